@@ -67,6 +67,16 @@ def clean_thai_lao_rom(item: str, mode: str):
 #         return value
 #     return False
 
+# Half mark sequences in romanised Cyrillic, and their double diacritic replacements
+_cyrillic_rom_replacements = [
+    (_regex.compile(r'([tT])\uFE20([sS])\uFE21\u0307'), r'\1\u0361\u034F\u0307\2'),
+    (_regex.compile(r'([tT])\uFE20\u0307([sS])\uFE21'), r'\1\u0361\u034F\u0307\2'),
+    (_regex.compile(r'([oO])\u0304\uFE20([tT])\uFE21'), r'\1\u0304\u0361\2'),
+    (_regex.compile(r'([iI])\uFE20([eEoO])\u0328\uFE21'), r'\1\u0361\2\u0328'),
+    (_regex.compile(r'([dD])\uFE20([zZ])\u030C\uFE21'), r'\1\u0361\1\u030C'),
+    (_regex.compile(r'([dDiIkKpnNPtTzZ])\uFE20([aAeEhHgGnNoOsSuUzZ])\uFE21'), r'\1\u0361\2')
+]
+
 def clean_cyrillic_rom(item: str) -> str:
     """Normalise Cyrillic romanisations.
 
@@ -79,12 +89,11 @@ def clean_cyrillic_rom(item: str) -> str:
     Returns:
         str: Normalised string
     """
-    item = _regex.sub(r'([tT])\uFE20([sS])\uFE21\u0307', r'\1\u0361\u034F\u0307\2', item)
-    item = _regex.sub(r'([tT])\uFE20\u0307([sS])\uFE21', r'\1\u0361\u034F\u0307\2', item)
-    item = _regex.sub(r'([oO])\u0304\uFE20([tT])\uFE21', r'\1\u0304\u0361\2', item)
-    item = _regex.sub(r'([iI])\uFE20([eEoO])\u0328\uFE21', r'\1\u0361\2\u0328', item)
-    item = _regex.sub(r'([dD])\uFE20([zZ])\u030C\uFE21', r'\1\u0361\1\u030C', item)
-    item = _regex.sub(r'([dDiIkKpnNPtTzZ])\uFE20([aAeEhHgGnNoOsSuUzZ])\uFE21', r'\1\u0361\2', item)
+    # Every sequence contains U+FE20, so other strings are returned unchanged.
+    if '\uFE20' not in item:
+        return item
+    for pattern, replacement in _cyrillic_rom_replacements:
+        item = pattern.sub(replacement, item)
     return item
 
 ##############################
@@ -104,7 +113,7 @@ def clean_marc_subfield(item: str, lang: str, norm_form: str = "NFD", thai_lao_r
     Returns:
         str: _description_
     """
-    if _regex.search(r'&#', item):
+    if '&#' in item:
         item = normalise("NFD", _html.unescape(item), use_icu=True)
     else:
         item = normalise("NFD", item, use_icu=True)
@@ -210,7 +219,7 @@ problem_chars.extend(list(_icu.UnicodeSet(r'\p{Cn}')))
 
 def detect_anomalies(text: str) -> set[str]:
     problematic = set()
-    if _regex.search(problem_chars_pattern, text):
+    if problem_chars_pattern.search(text):
         for char in problem_chars:
             if char in text:
                 problematic.add(f"{codepoints(char)} ({_unicodedataplus.name(char)})")
@@ -13,6 +13,7 @@ from bidi.algorithm import get_display as _get_display
 from pyfribidi import log2vis as _log2vis, RTL as _RTL
 from collections import Counter as _Counter
 import unicodedataplus as _unicodedataplus
+from functools import lru_cache as _lru_cache
 
 ####################
 #
@@ -20,6 +21,8 @@ import unicodedataplus as _unicodedataplus
 #
 ####################
 
+_bidi_pattern = _regex.compile(r'[\p{bc=AL}\p{bc=AN}\p{bc=LRE}\p{bc=RLE}\p{bc=LRO}\p{bc=RLO}\p{bc=PDF}\p{bc=FSI}\p{bc=RLI}\p{bc=LRI}\p{bc=PDI}\p{bc=R}]')
+
 def is_bidi(text):
     """Indicates if string requires bidirectional support for RTL characters.
 
@@ -31,8 +34,10 @@ def is_bidi(text):
     Returns:
         bool: returns True if the string is RTL, returns False otherwise.
     """
-    bidi_reg = r'[\p{bc=AL}\p{bc=AN}\p{bc=LRE}\p{bc=RLE}\p{bc=LRO}\p{bc=RLO}\p{bc=PDF}\p{bc=FSI}\p{bc=RLI}\p{bc=LRI}\p{bc=PDI}\p{bc=R}]'
-    return bool(_regex.search(bidi_reg, text))
+    # No ASCII character has an RTL or explicit formatting bidi class.
+    if text.isascii():
+        return False
+    return bool(_bidi_pattern.search(text))
 
 isbidi = is_bidi
 
@@ -86,6 +91,8 @@ envelope = bidi_envelope
 #
 ####################
 
+_bidi_formatting_pattern = _regex.compile('[\u202a-\u202e\u2066-\u2069]')
+
 def strip_bidi(text):
     """Strip bidi formatting characters.
 
@@ -97,7 +104,7 @@ def strip_bidi(text):
     Returns:
         str: _description_
     """
-    return _regex.sub('[\u202a-\u202e\u2066-\u2069]', '', text)
+    return _bidi_formatting_pattern.sub('', text)
 
 ####################
 #
@@ -143,15 +150,25 @@ def rtl_hack(text: str, arabic: bool = True, fribidi: bool = True) -> str:
 #
 ####################
 
+_presentation_forms_pattern = _regex.compile(r'([\p{InAlphabetic_Presentation_Forms}\p{InArabic_Presentation_Forms-A}\p{InArabic_Presentation_Forms-B}]+)')
+
 def has_presentation_forms(text):
-    pattern = r'([\p{InAlphabetic_Presentation_Forms}\p{InArabic_Presentation_Forms-A}\p{InArabic_Presentation_Forms-B}]+)'
-    return bool(_regex.findall(pattern, text))
+    if text.isascii():
+        return False
+    return bool(_presentation_forms_pattern.search(text))
 
 def clean_presentation_forms(text, folding=False):
+    if text.isascii():
+        return text
     def clean_pf(match, folding):
         return  match.group(1).casefold() if folding else _unicodedataplus.normalize("NFKC", match.group(1))
-    pattern = r'([\p{InAlphabetic_Presentation_Forms}\p{InArabic_Presentation_Forms-A}\p{InArabic_Presentation_Forms-B}]+)'
-    return _regex.sub(pattern, lambda match, folding=folding: clean_pf(match, folding), text)
+    return _presentation_forms_pattern.sub(lambda match, folding=folding: clean_pf(match, folding), text)
+
+_bidi_formatting_marks_pattern = _regex.compile(r'[\u200e\u200f\u202a-\u202e\u2066-\u2069]')
+_isolate_initiators = frozenset('\u2066\u2067\u2068')
+_embedding_initiators = frozenset('\u202A\u202B')
+_override_initiators = frozenset('\u202D\u202E')
+_bidi_marks = frozenset('\u200E\u200F')
 
 def scan_bidi(text):
     """Analyse string for bidi support.
@@ -172,12 +189,13 @@ def scan_bidi(text):
         Tuple[bool, bool, bool, bool, bool, Set[Optional[str]], bool]: Summary of bidi support analysis
     """
     bidi_status = is_bidi(text)
-    isolates = bool(_regex.search(r'[\u2066\u2067\u2068]', text)) and bool(_regex.search(r'\u2069', text))
-    embeddings = bool(_regex.search(r'[\u202A\u202B]', text)) and bool(_regex.search(r'\u202C', text))
-    marks = bool(_regex.search(r'[\u200E\u200F]', text))
-    overrides = bool(_regex.search(r'[\u202D\u202E]', text)) and bool(_regex.search(r'\u202C', text))
-    formating_characters = set(_regex.findall(r'[\u200e\u200f\u202a-\u202e\u2066-\u2069]', text))
-    formating_characters = {f"U+{ord(c):04X} ({_unicodedataplus.name(c,'-')})" for c in formating_characters if formating_characters is not None}
+    # A single scan collects the formatting characters, each flag is then a set test.
+    formating_characters = set(_bidi_formatting_marks_pattern.findall(text))
+    isolates = not formating_characters.isdisjoint(_isolate_initiators) and '\u2069' in formating_characters
+    embeddings = not formating_characters.isdisjoint(_embedding_initiators) and '\u202C' in formating_characters
+    marks = not formating_characters.isdisjoint(_bidi_marks)
+    overrides = not formating_characters.isdisjoint(_override_initiators) and '\u202C' in formating_characters
+    formating_characters = {f"U+{ord(c):04X} ({_unicodedataplus.name(c,'-')})" for c in formating_characters}
     presentation_forms = has_presentation_forms(text)
     return (bidi_status, isolates, embeddings, marks, overrides, formating_characters, presentation_forms)
 
@@ -191,17 +209,22 @@ scan = scan_bidi
 #
 ####################
 
+# Bidi class lookups, texts rarely use more than a small alphabet.
+_bidirectional = _lru_cache(maxsize=4096)(_unicodedataplus.bidirectional)
+
 def first_strong(s):
-    properties = ['ltr' if v == "L" else 'rtl' if v in ["AL", "R"] else "-" for v in [_unicodedataplus.bidirectional(c) for c in list(s)]]
-    for value in properties:
-        if value == "ltr":
+    for value in map(_bidirectional, s):
+        if value == "L":
             return "ltr"
-        elif value == "rtl":
+        elif value in ("AL", "R"):
             return "rtl"
     return None
 
 def dominant_strong_direction(s):
-    count = _Counter([_unicodedataplus.bidirectional(c) for c in list(s)])
+    # Look up the bidi class once per distinct character, weighted by its frequency.
+    count = _Counter()
+    for char, n in _Counter(s).items():
+        count[_bidirectional(char)] += n
     rtl_count = count['R'] + count['AL'] + count['RLE'] + count["RLI"]
     ltr_count = count['L'] + count['LRE'] + count["LRI"] 
     return "rtl" if rtl_count > ltr_count else "ltr"
@@ -43,9 +43,10 @@ other_start = [
 ]
 
 formatting_chars_pattern: str = rf'[{",".join(formatting_chars)}]'
+_formatting_chars_regex = _regex.compile(formatting_chars_pattern)
 
 def has_any_dir_format_chars(text: str) -> bool:
-    return bool(_regex.search(formatting_chars_pattern, text))
+    return bool(_formatting_chars_regex.search(text))
 
 # # U+061C ARABIC LETTER MARK
 # ARABIC LETTER MARK = '\u061C'
@@ -14,6 +14,13 @@ from hexdump import hexdump as _hexdump
 BINARY_PROPERTIES = [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 36, 42, 43, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64]
 ICU_VERSION = float('.'.join(_icu.ICU_VERSION.split('.')[0:2]))
 
+# Normalizer2 instances are immutable, and can be shared.
+_nfd_normaliser = _icu.Normalizer2.getNFDInstance()
+_nfkd_normaliser = _icu.Normalizer2.getNFKDInstance()
+_nfc_normaliser = _icu.Normalizer2.getNFCInstance()
+_nfkc_normaliser = _icu.Normalizer2.getNFKCInstance()
+_nfkc_cf_normaliser = _icu.Normalizer2.getNFKCCasefoldInstance()
+
 class InvalidCharLengthException(Exception):
     "Raised when the method requires exactly one character, but additional characters were given."
     pass
@@ -214,7 +221,7 @@ class ucd():
     ids_trinary_operator = _partialmethod(_get_property, property = _icu.UProperty.IDS_TRINARY_OPERATOR, short_name = False)
 
     def in_set(self, uset):
-        return True if self._char in list(_icu.UnicodeSet(uset)) else False
+        return _icu.UnicodeSet(uset).contains(self._char)
 
     indic_positional_category = _partialmethod(_get_property, property = _icu.UProperty.INDIC_POSITIONAL_CATEGORY, short_name = False)
     indic_syllabic_category = _partialmethod(_get_property, property = _icu.UProperty.INDIC_SYLLABIC_CATEGORY, short_name = False)
@@ -281,22 +288,22 @@ class ucd():
 
     def is_nfc(self):
         char = self._char
-        norm_char = _icu.Normalizer2.getNFCInstance().normalize(char)
+        norm_char = _nfc_normaliser.normalize(char)
         return norm_char == char
 
     def is_nfkc(self):
         char = self._char
-        norm_char = _icu.Normalizer2.getNFKCInstance().normalize(char)
+        norm_char = _nfkc_normaliser.normalize(char)
         return norm_char == char
 
     def is_nfd(self):
         char = self._char
-        norm_char = _icu.Normalizer2.getNFDInstance().normalize(char)
+        norm_char = _nfd_normaliser.normalize(char)
         return norm_char == char
 
     def is_nfkd(self):
         char = self._char
-        norm_char = _icu.Normalizer2.getNFKDInstance().normalize(char)
+        norm_char = _nfkd_normaliser.normalize(char)
         return norm_char == char
 
     def is_print(self):
@@ -361,24 +368,22 @@ class ucd():
     nfc_quick_check = _partialmethod(_get_property, property = _icu.UProperty.NFC_QUICK_CHECK, short_name = False)
 
     def nfd_contains(self, uset=_icu.UnicodeSet(r'[:Latin:]')) -> list[str]:
-        normalizer = _icu.Normalizer2.getNFDInstance()
         domain = list(uset)
-        return [item for item in domain if self._char in normalizer.normalize(item)]
+        return [item for item in domain if self._char in _nfd_normaliser.normalize(item)]
 
     nfd_inert = _partialmethod(_get_property, property = _icu.UProperty.NFD_INERT, short_name = False)
     nfd_quick_check = _partialmethod(_get_property, property = _icu.UProperty.NFD_QUICK_CHECK, short_name = False)
 
     def nfkc_casefold(self):
-        return _icu.Normalizer2.getNFKCCasefoldInstance().normalize(self._char)
+        return _nfkc_cf_normaliser.normalize(self._char)
 
     nfkc_inert = _partialmethod(_get_property, property = _icu.UProperty.NFKC_INERT, short_name = False)
     nfkc_quick_check = _partialmethod(_get_property, property = _icu.UProperty.NFKC_QUICK_CHECK, short_name = False)
 
     def nfkd_contains(self, uset=_icu.UnicodeSet(r'[:Latin:]')) -> list[str]:
         # _icu.ucd('b').nfkd_contains(_icu.UnicodeSet(r'[:Any:]'))
-        normalizer = _icu.Normalizer2.getNFKDInstance()
         domain = list(uset)
-        return [item for item in domain if self._char in normalizer.normalize(item)]
+        return [item for item in domain if self._char in _nfkd_normaliser.normalize(item)]
 
     nfkd_inert = _partialmethod(_get_property, property = _icu.UProperty.NFKD_INERT, short_name = False)
     nfkd_quick_check = _partialmethod(_get_property, property = _icu.UProperty.NFKD_QUICK_CHECK, short_name = False)
@@ -524,7 +529,8 @@ def unicode_data(text):
     Args:
         text (str): string to analyse.
     """
-    data = ucd_str(text).data
+    # Character properties are looked up once for each distinct character.
+    rows = {char: ucd(char).data for char in dict.fromkeys(text)}
     console = _Console()
     table = _Table(
         show_header=True,
@@ -540,7 +546,8 @@ def unicode_data(text):
     table.add_column("cat")
     table.add_column("bidi")
     table.add_column("cc")
-    for datum in data:
+    for char in text:
+        datum = rows[char]
         table.add_row(
             datum[0],
             datum[1],
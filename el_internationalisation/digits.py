@@ -17,6 +17,9 @@ import locale as _locale, icu as _icu
 #
 # To Western Arabic digits
 #
+_formatted_digits_pattern = _regex.compile(r'^-?\p{Nd}[,.\u066B\u066C\u0020\u2009\u202F\p{Nd}]*$')
+_formatted_number_pattern = _regex.compile(r'^-?\p{Nd}[,.\u066B\u066C\u0020\u2009\u202F\p{Nd}]+$')
+
 def convert_digits(text, sep = (",", "."), use_icu=False):
     """Convert formatted number, including native digits, to Western Arabic digits.
 
@@ -28,7 +31,7 @@ def convert_digits(text, sep = (",", "."), use_icu=False):
     Returns:
         Union[int, float, None]: integer or float equivalent of the string representation of th input number
     """
-    nd = _regex.compile(r'^-?\p{Nd}[,.\u066B\u066C\u0020\u2009\u202F\p{Nd}]*$')
+    nd = _formatted_digits_pattern
     tsep, dsep = sep
     if nd.match(text):
         text = text.replace(tsep, "")
@@ -42,7 +45,7 @@ def convert_digits(text, sep = (",", "."), use_icu=False):
     return None
 
 def is_number(v, sep = (",", ".")):
-    nd = _regex.compile(r'^-?\p{Nd}[,.\u066B\u066C\u0020\u2009\u202F\p{Nd}]+$')
+    nd = _formatted_number_pattern
     v = "".join(v.split())
     if isinstance(v, int) or isinstance(v, float):
         return isinstance(v, (int, str)), type(v), v
@@ -1,10 +1,10 @@
 import regex as _regex, icu as _icu, collections as _collections
 import pathlib as _pathlib, sys as _sys
 from .transliteration_data import SUPPORTED_TRANSLITERATORS, TRANSLIT_DATA
-from .ustrings import normalise
-import copy as _copy
+from .ustrings import normalise, get_transliterator as _get_transliterator, is_transliterator_id as _is_transliterator_id, available_transliterator_ids as _available_transliterator_ids, refresh_transliterator_ids as _refresh_transliterator_ids
 import requests as _requests
 import xml.etree.ElementTree as _ET
+from functools import lru_cache as _lru_cache
 
 # TODO:
 #  * add type hinting
@@ -12,6 +12,9 @@ import xml.etree.ElementTree as _ET
 
 DEFAULT_NF = "NFM21"
 
+# Locales with collation data, fixed when ICU is built.
+_collator_locales = frozenset(_icu.Collator.getAvailableLocales().keys())
+
 def toNFM21(text, engine="ud"):
     if engine.lower() == "_icu":
         return normalise("NFM21", text)
@@ -44,11 +47,7 @@ def el_transliterate(source, lang, dir = "forward", nf = DEFAULT_NF):
         translit_table = SUPPORTED_TRANSLITERATORS[lang]
         nf = nf.upper() if nf.upper() in ["NFC", "NFKC", "NFKC_CF", "NFD", "NFKD", "NFM"] else DEFAULT_NF
         source = prep_string(source, dir, lang, translit_table[1])
-        if dir == "forward":
-            collator = _icu.Collator.createInstance(_icu.Locale.getRoot())
-        else:
-            collator = _icu.Collator.createInstance(_icu.Locale(lang))
-        if dir == "reverse" and lang in list(_icu.Collator.getAvailableLocales().keys()):
+        if dir == "reverse" and lang in _collator_locales:
             collator = _icu.Collator.createInstance(_icu.Locale(lang))
         else:
             collator = _icu.Collator.createInstance(_icu.Locale.getRoot())
@@ -75,21 +74,31 @@ def el_transliterate(source, lang, dir = "forward", nf = DEFAULT_NF):
 
 # Available transforms
 def available_transforms(term = None):
-    available = list(_icu.Transliterator.getAvailableIDs())
+    available = _available_transliterator_ids()
     if term is None:
         return available
     return [x for x in available if term.lower() in x.lower()]
 
 # transliterate from inbuilt ICU transform
 def translit__icu(source, transform):
-    if transform not in available_transforms():
+    if not _is_transliterator_id(transform):
         print(f'Unsupported transformation. Not available in _icu4c {_icu.ICU_VERSION}')
         return
-    transformer = _icu.Transliterator.createInstance(transform)
+    transformer = _get_transliterator(transform)
     if isinstance(source, list):
         return [transformer.transliterate(item) for item in source]
     return transformer.transliterate(source)
 
+# Remote LDML files are downloaded once per session, failed requests are not cached.
+@_lru_cache(maxsize=32)
+def _fetch_ldml(url):
+    r = _requests.get(url)
+    r.raise_for_status()
+    return r.content.decode('UTF-8')
+
+_ldml_rule_whitespace_pattern = _regex.compile(r'[ \t]{2,}|[ ]*#.+\n')
+_ldml_rule_separator_pattern = _regex.compile('[\n#]')
+
 # READ transliteration rules from LDML file, either locale file path or URL
 def read_ldml_rules(ldml_file):
     """Read transliteration rules from LDML file
@@ -107,9 +116,8 @@ def read_ldml_rules(ldml_file):
             r = ldml_xml.find('./transforms/transform')
         if r is None:
             _sys.stderr(f"Can't find transform in {rules_file}")
-        pattern = _regex.compile(r'[ \t]{2,}|[ ]*#.+\n')
-        rules = _regex.sub(pattern, '', r.find('./tRule').text)
-        rules = _regex.sub('[\n#]', '', rules)
+        rules = _ldml_rule_whitespace_pattern.sub('', r.find('./tRule').text)
+        rules = _ldml_rule_separator_pattern.sub('', rules)
         rules_name = r.attrib['alias'].split()[0]
         reverse_name = ''
         # if r.attrib['backwardAlias']:
@@ -119,8 +127,7 @@ def read_ldml_rules(ldml_file):
 
     def get_ldml(rules_file):
         if rules_file.startswith(('https://', 'http://')):
-            r=_requests.get(rules_file)
-            doc = _ET.ElementTree(_ET.fromstring(r.content.decode('UTF-8')))
+            doc = _ET.ElementTree(_ET.fromstring(_fetch_ldml(rules_file)))
         else:
             doc = _ET.parse(rules_file)
         return extract_rules(doc, rules_file)
@@ -136,6 +143,9 @@ def register_ldml(ldml_file):
     if ldml_rules[2]:
         reverse_ldml_transformer = _icu.Transliterator.createFromRules(ldml_rules[2], ldml_rules[0], _icu.UTransDirection.REVERSE)
         _icu.Transliterator.registerInstance(reverse_ldml_transformer)
+    # Registered IDs may replace transliterators that are already cached
+    _get_transliterator.cache_clear()
+    _refresh_transliterator_ids()
 
 # transform from custom rules
 def translit_rules(source, rules, direction = _icu.UTransDirection.FORWARD, name = "Custom"):
@@ -176,23 +186,25 @@ def set_ldml_file_path(raw_path):
         print("LDML does not exist.")
 
 # Get language subtag form a BCP-47 langauge tage or from a locale label
+_script_subtag_pattern = _regex.compile(r"^([A-Z][a-z]{3})$")
+_region_subtag_pattern = _regex.compile(r"^([A-Z]{2})$")
+
 def get_lang_subtag(lang):
     subtags = lang.replace("-", "_").split('_')
-    remainder = _copy.deepcopy(subtags)
+    remainder = subtags[1:]
     lang_subtag = subtags[0]
-    remainder.pop(0)
     script_subtag = ""
     country_subtag = ""
     # if len(subtags) > 1:
     if 1 < len(subtags):
-        if bool(_regex.match(r"^([A-Z][a-z]{3})$", subtags[1])):
+        if bool(_script_subtag_pattern.match(subtags[1])):
             script_subtag = subtags[1]
             remainder.pop(0)
-        elif bool(_regex.match(r"^([A-Z]{2})$", subtags[1])):
+        elif bool(_region_subtag_pattern.match(subtags[1])):
             country_subtag = subtags[1]
             remainder.pop(0)
     if 2 < len(subtags):
-        if bool(_regex.match(r"^([A-Z]{2})$", subtags[2])):
+        if bool(_region_subtag_pattern.match(subtags[2])):
             country_subtag = subtags[2]
             remainder.pop(0)
     remainder_str = "-".join(remainder) if len(remainder) > 0 else ""
@@ -214,7 +226,7 @@ def translit_dict(source, lang, dir = "forward", nf = DEFAULT_NF):
         #     collator = _icu.Collator.createInstance(_icu.Locale(lang))
         # else:
         #     collator = _icu.Collator.createInstance(_icu.Locale.getRoot())
-        if dir == "reverse" and lang in list(_icu.Collator.getAvailableLocales().keys()):
+        if dir == "reverse" and lang in _collator_locales:
             collator = _icu.Collator.createInstance(_icu.Locale(lang))
         else:
             collator = _icu.Collator.createInstance(_icu.Locale.getRoot())
@@ -257,7 +269,7 @@ def to_ascii(text: str, latin_only: bool = True) -> str:
         str: Transformed string.
     """
     if latin_only:
-        transliterator = _icu.Transliterator.createInstance('Latin-ASCII')
+        transliterator = _get_transliterator('Latin-ASCII')
     else:
-        transliterator = _icu.Transliterator.createInstance('Any-Latin; Latin-ASCII')
+        transliterator = _get_transliterator('Any-Latin; Latin-ASCII')
     return transliterator.transliterate(text)
\ No newline at end of file
@@ -8,12 +8,19 @@
 
 from collections import Counter as _Counter, UserString as _UserString
 from collections.abc import Sequence as _Sequence
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 import icu as _icu
+import os as _os
 import regex as _regex
+import threading as _threading
 import unicodedataplus as _unicodedataplus
 from .bidi import bidi_envelope, is_bidi, first_strong, dominant_strong_direction
-from functools import partial as _partial
-from wcwidth import wcswidth as _wcswidth
+from functools import lru_cache as _lru_cache, partial as _partial
+from itertools import islice as _islice, pairwise as _pairwise, repeat as _repeat
+try:
+  from cwcwidth import wcswidth as _wcswidth
+except ImportError:
+  from wcwidth import wcswidth as _wcswidth
 from el_data import udata, EthiopicUCDString as _Ethi
 try:
   from typing import Self as _Self
@@ -37,6 +44,21 @@ ICU_VERSION = _icu.ICU_VERSION
 PYICU_VERSION = _icu.VERSION
 ICU_UNICODE_VERSION = _icu.UNICODE_VERSION
 
+# Longest string whose results are kept by the graphemes() and codepoints() caches.
+# With CACHE_MAX_ENTRIES entries, a full graphemes() cache of CJK text holds about 22 MB.
+CACHE_MAX_LENGTH = 256
+CACHE_MAX_ENTRIES = 1024
+
+# Match keys are kept by the *_match functions for strings shorter than this.
+MATCH_KEY_MAX_LENGTH = 1024
+
+# Compiled regular expressions for user supplied or generated patterns.
+_compile_pattern = _lru_cache(maxsize=256)(_regex.compile)
+
+# Per character property lookups, texts rarely use more than a small alphabet.
+_script = _lru_cache(maxsize=4096)(_unicodedataplus.script)
+_combining = _lru_cache(maxsize=4096)(_unicodedataplus.combining)
+
 ####################
 #
 # Utility functions
@@ -62,7 +84,13 @@ def count_characters(text, localeID, auxiliary=False, to_dict=False):
       return dict(c) if to_dict else c
 
 def count_ngraphs(text, ngram_length=2):
-      return _Counter(text[idx : idx + ngram_length] for idx in range(len(text) - 1))
+      """Count each run of ngram_length consecutive characters in text.
+
+      Raises ValueError if ngram_length is below 1.
+      """
+      if ngram_length < 1:
+            raise ValueError("ngram_length must be at least 1.")
+      return _Counter(map("".join, zip(*(text[offset:] for offset in range(ngram_length)))))
 
 ####################
 # analyse characters
@@ -105,6 +133,8 @@ def utf16len(text):
     """
     return len(text.encode('utf-16-le'))
 
+_combining_char_pattern = _regex.compile(r'\P{ccc=0}')
+
 def add_dotted_circle(text):
     """Add dotted circle to combining diacritics in a string.
 
@@ -114,7 +144,9 @@ def add_dotted_circle(text):
     Returns:
         str: transformed string with combining diacritics in string applied to a dotted circle.
     """
-    return "".join(["\u25CC" + i if _unicodedataplus.combining(i) else i for i in list(text)])
+    if text.isascii() or not _combining_char_pattern.search(text):
+        return text
+    return "".join(["\u25CC" + i if _combining(i) else i for i in text])
 
 # codepoints and characters in string
 #
@@ -134,12 +166,34 @@ def codepoints(text: str, prefix: bool = False, extended: bool = False) -> str |
     Returns:
         str | _Sequence[CharData]: string of Unicode codepoints in analysed string, or if extended a list of tuples containing teh character, codepoint, and character name
     """
+    if type(text) is str and len(text) <= CACHE_MAX_LENGTH:
+        result = _cached_codepoints(text, prefix, extended)
+        return list(result) if extended else result
+    return _codepoints(text, prefix, extended)
+cp = codepoints
+
+# Labels are cached per character, since most texts reuse a small repertoire.
+@_lru_cache(maxsize=4096)
+def _codepoint_label(char: str, prefix: bool) -> str:
+    return f"U+{ord(char):04X}" if prefix else f"{ord(char):04X}"
+
+@_lru_cache(maxsize=4096)
+def _codepoint_data(char: str, prefix: bool) -> Char:
+    return (char, _codepoint_label(char, prefix), _unicodedataplus.name(char))
+
+def _codepoints(text: str, prefix: bool, extended: bool) -> str | list[Char]:
     if extended:
-        return [(c, f"U+{ord(c):04X}", _unicodedataplus.name(c)) for c in text] if prefix else [(c, f"{ord(c):04X}", _unicodedataplus.name(c)) for c in text]
+        return list(map(_codepoint_data, text, _repeat(prefix)))
     else:
         # return ' '.join('U+{:04X}'.format(ord(c)) for c in text) if prefix else ' '.join('{:04X}'.format(ord(c)) for c in text)
-        return ' '.join(f"U+{ord(c):04X}" for c in text) if prefix else ' '.join(f"{ord(c):04X}" for c in text)
-cp = codepoints
+        return ' '.join(map(_codepoint_label, text, _repeat(prefix)))
+
+@_lru_cache(maxsize=CACHE_MAX_ENTRIES)
+def _cached_codepoints(text: str, prefix: bool, extended: bool) -> str | tuple[Char, ...]:
+    result = _codepoints(text, prefix, extended)
+    return tuple(result) if extended else result
+
+_codepoint_separator_pattern = _regex.compile(r",\s*|\s+")
 
 def codepointsToChar(codepoints):
     """Convert a string of comma or space separated unicode codepoints to characters.
@@ -155,35 +209,37 @@ def codepointsToChar(codepoints):
     Returns:
         str: Unicode characters represented by the codepoints
     """
-    codepoints = codepoints.lower().replace("u+", "")
-    cplist = _regex.split(r",\s*|\s+", codepoints)
-    return "".join([chr(int(c, 16)) for c in cplist])
+    codepoints = codepoints.lower().replace("u+", "").strip()
+    cplist = _codepoint_separator_pattern.split(codepoints)
+    return "".join([chr(int(c, 16)) for c in cplist if c])
     # return "".join([chr(int(i.removeprefix('u+'), 16)) for i in _regex.split(r'[,;]\s?|\s+', cps.lower())])
 
-def canonical_equivalents_str(ustring):
+def canonical_equivalents_str(ustring, limit=None):
     """List canonically equivalent strings for given string.
 
     Args:
         ustring (str): character, grapheme or short string to analyse.
+        limit (int, optional): Maximum number of equivalent forms to return. Defaults to None, i.e. all forms.
 
     Returns:
         List[str]: list of all canonically equivalent forms of ustring.
     """
     ci =  _icu.CanonicalIterator(ustring)
-    return [' '.join(f"U+{ord(c):04X}" for c in char) for char in ci]
+    return [codepoints(char, prefix=True) for char in _islice(ci, limit)]
 
-def canonical_equivalents(ci, ustring = None):
+def canonical_equivalents(ci, ustring = None, limit=None):
     """List canonically equivalent strings for given canonical iterator instance.
 
     Args:
         ci (_icu.CanonicalIterator): a CanonicalIterator instance.
+        limit (int, optional): Maximum number of equivalent forms to return. Defaults to None, i.e. all forms.
 
     Returns:
         List[str]: list of all canonically equivalent forms of ustring.
     """
     if ustring:
         ci.setSource(ustring)
-    return [' '.join(f"U+{ord(c):04X}" for c in char) for char in ci]
+    return [codepoints(char, prefix=True) for char in _islice(ci, limit)]
 
 # def unicode_data(text, ce=False):
 #     """Display Unicode data for each character in string.
@@ -214,8 +270,12 @@ def canonical_equivalents(ci, ustring = None):
 # 
 # udata = unicode_data
 
+@_lru_cache(maxsize=4096)
+def _codepoint_name(char: str) -> tuple[str, str]:
+    return (_codepoint_label(char, True), _unicodedataplus.name(char,'-'))
+
 def codepoint_names(text):
-    return [(f"U+{ord(c):04X}", _unicodedataplus.name(c,'-')) for c in text]
+    return list(map(_codepoint_name, text))
 
 cpnames = codepoint_names
 
@@ -228,9 +288,22 @@ printl = print_list
 # text = "ꗏ ꕘꕞꘋ ꔳꕩ"
 # printl(cpname(text))
 
+@_lru_cache(maxsize=64)
+def _script_set(script: str, common: bool) -> _icu.UnicodeSet | None:
+    # Frozen set of the script's code points, optionally with Common, for whole-string membership tests.
+    # None when ICU does not recognise the script name, so the regex module can try it instead.
+    try:
+        uset = _icu.UnicodeSet(f'[[:{script}:][:Common:]]' if common else f'[:{script}:]')
+    except _icu.ICUError:
+        return None
+    uset.freeze()
+    return uset
+
 def isScript(text:str , script:str , common:bool=False) -> bool:
     """Test if characters in string belong to specified script.
 
+    As with an anchored regular expression, a single trailing newline is ignored.
+
     Args:
         text (str): String to test.
         script (str): Script to match against.
@@ -239,16 +312,25 @@ def isScript(text:str , script:str , common:bool=False) -> bool:
     Returns:
         bool: Result of string tested against specified script.
     """
-    pattern_string = r'^[\p{' + script + r'}\p{Common}]+$' if common else r'^\p{' + script + r'}+$'
-    pattern = _regex.compile(pattern_string)
-    return bool(_regex.match(pattern, text))
+    uset = _script_set(script, common)
+    if uset is None:
+        pattern_string = r'^[\p{' + script + r'}\p{Common}]+$' if common else r'^\p{' + script + r'}+$'
+        return bool(_compile_pattern(pattern_string).match(text))
+    if not text:
+        return False
+    # "$" in the regex this replaces also matched before a final newline.
+    return uset.containsAll(text) or (len(text) > 1 and text.endswith("\n") and uset.containsAll(text[:-1]))
 
 def dominant_script(text, mode="individual"):
-    count = _Counter([_unicodedataplus.script(char) for char in text])
-    total = sum(count.values())
+    # Look up the script once per distinct character, weighted by its frequency.
+    count = _Counter()
+    for char, n in _Counter(text).items():
+        count[_script(char)] += n
+    total = len(text)
     if mode == "all":
-        return [(i, count[i]/total) for i in list(count)]
-    dominant = (count.most_common(2)[0][0], count.most_common(2)[0][1]/total) if count.most_common(2)[0][0] != "Common" else (count.most_common(2)[1][0],  count.most_common(2)[1][1]/total)
+        return [(i, n/total) for i, n in count.items()]
+    top = count.most_common(2)
+    dominant = (top[0][0], top[0][1]/total) if top[0][0] != "Common" else (top[1][0],  top[1][1]/total)
     return dominant
 
 class ngraphs:
@@ -259,7 +341,8 @@ class ngraphs:
     text: str
         A plain text string to be analysed. Specific to ngraph instance.
     size: int
-        Size of ngraph. 2 = digraph, 3 = character, etc. Defaults to 2
+        Size of ngraph. 2 = digraph, 3 = character, etc. Defaults to 2.
+        Sizes below 1 raise ValueError.
     filter: bool
         Filter out punctuation and whitespace, so that these characters do not appear
         in the ngraphs. Defaults to False
@@ -346,13 +429,17 @@ class ngraphs:
         # pattern = f'[^\p\u007bP\u007d\p\u007bZ\u007d]\u007b{self.size}\u007d'
         pattern = r'[^\p{P}\p{Z}]{' + str(self.size) + r'}'
         r = {}
-        if self.graphemes:
-            gr = graphemes(self.text)
-            c = {"".join(i for i in k): v for k, v in dict(_Counter(tuple(gr)[idx : idx + self.size] for idx in range(len(gr) - 1))).items()}
+        if self.size < 1:
+            raise ValueError("size must be at least 1.")
+        # Zipping offset copies of the sequence yields every run of self.size items.
+        units = graphemes(self.text) if self.graphemes else self.text
+        c = _Counter(map("".join, zip(*(units[offset:] for offset in range(self.size)))))
+        # most_common() ranks by count in C, and filtering keeps that order.
+        if self.filter:
+            match = _compile_pattern(pattern).match
+            r = {x: count for x, count in c.most_common() if match(x)}
         else:
-            c = _Counter(self.text[idx : idx + self.size] for idx in range(len(self.text) - 1))
-        r = {x: count for x, count in c.items() if _regex.match(pattern, x)} if self.filter else dict(c)
-        r = dict(sorted(r.items(), key=lambda x:x[1], reverse=True))
+            r = dict(c.most_common())
         return r
         # return {"size":self.size, "filter":self.filter ,"ngraths": r}
 
@@ -400,21 +487,44 @@ class ngraphs:
 #    'core' uses the Python3 definition.
 #
 ####################
+_alpha_el_char_pattern = _regex.compile(r'[\p{Alphabetic}\p{Mn}\p{Mc}\u00B7]')
+_alpha_el_pattern = _regex.compile(r'^\p{Alphabetic}[\p{Alphabetic}\p{Mn}\p{Mc}\u00B7]*$')
+_alpha_unicode_pattern = _regex.compile(r'^\p{Alphabetic}+$')
+
+# ASCII letters and digits are always alphabetic or word forming, so ASCII
+# words can be accepted without running the regex engine. Other single ASCII
+# characters, and the empty string, can be rejected the same way.
+def _ascii_alpha(text):
+    if text.isascii():
+        if text.isalpha():
+            return True
+        # The patterns' "$" also matches before a trailing newline, so those are left to the regex.
+        if len(text) <= 1 or not text.endswith("\n"):
+            return False
+    return None
+
 def isalpha(text, mode="unicode"):
+    if not mode or mode.lower() in ("el", "unicode"):
+        result = _ascii_alpha(text)
+        if result is not None:
+            return result
     if (not mode) or (mode.lower() == "el"):
         if len(text) == 1:
-            result = bool(_regex.match(r'[\p{Alphabetic}\p{Mn}\p{Mc}\u00B7]', text))
+            result = bool(_alpha_el_char_pattern.match(text))
         else:
-            result = bool(_regex.match(r'^\p{Alphabetic}[\p{Alphabetic}\p{Mn}\p{Mc}\u00B7]*$', text))
+            result = bool(_alpha_el_pattern.match(text))
     elif mode.lower() == "unicode":
-        result = bool(_regex.match(r'^\p{Alphabetic}+$', text))        # Unicode Alphabetic derived property
+        result = bool(_alpha_unicode_pattern.match(text))        # Unicode Alphabetic derived property
     else:
         result = text.isalpha()          # core python3 isalpha()
     return result
 
 # Unicode Alphabetic derived property
 def isalpha_unicode(text):
-    return bool(_regex.match(r'^\p{Alphabetic}+$', text))
+    result = _ascii_alpha(text)
+    if result is not None:
+        return result
+    return bool(_alpha_unicode_pattern.match(text))
 
 ####################
 #
@@ -425,6 +535,13 @@ def isalpha_unicode(text):
 #
 ####################
 
+_word_forming_chars = r'\p{alpha}\p{gc=Mark}\p{digit}\p{gc=Connector_Punctuation}\p{Join_Control}'
+_word_forming_char_pattern = _regex.compile(f'[{_word_forming_chars}]')
+_word_forming_pattern = _regex.compile(f'^[{_word_forming_chars}]*$')
+_word_forming_extended_pattern = _regex.compile(rf'^[{_word_forming_chars}\u002D\u002E\u00B7]*$')
+_ascii_word_forming = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
+_ascii_word_forming_extended = _ascii_word_forming | frozenset('-.')
+
 def is_word_forming(text: str, extended: bool = False) -> bool:
     """Test whether a string contains only word forming characters.
 
@@ -440,14 +557,18 @@ def is_word_forming(text: str, extended: bool = False) -> bool:
     Returns:
         bool: result, either True or False.
     """
-    pattern = r'\p{alpha}\p{gc=Mark}\p{digit}\p{gc=Connector_Punctuation}\p{Join_Control}'
+    if text.isascii():
+        if _ascii_word_forming.issuperset(text):
+            return True
+        if len(text) == 1:
+            return False
+        if not text.endswith("\n"):
+            return extended and _ascii_word_forming_extended.issuperset(text)
     if len(text) == 1:
-        extended = False
+        return bool(_word_forming_char_pattern.match(text))
     if extended:
-        pattern = r'\p{alpha}\p{gc=Mark}\p{digit}\p{gc=Connector_Punctuation}\p{Join_Control}\u002D\u002E\u00B7'
-    if len(text) == 1:
-        return bool(_regex.match(f'[{pattern}]', text))
-    return bool(_regex.match(f'^[{pattern}]*$', text))
+        return bool(_word_forming_extended_pattern.match(text))
+    return bool(_word_forming_pattern.match(text))
 
 ####################
 #
@@ -467,50 +588,149 @@ def register_transformation(id: str, rules: str, direction: int = _icu.UTransDir
     Returns:
         None:
     """
-    if id not in list(_icu.Transliterator.getAvailableIDs()):
+    if not is_transliterator_id(id):
         transformer = _icu.Transliterator.createFromRules(id, rules, direction)
         _icu.Transliterator.registerInstance(transformer)
+        refresh_transliterator_ids()
     return None
 
+# Available transliterator IDs are enumerated once, and refreshed after registration.
+@_lru_cache(maxsize=1)
+def _available_transliterator_ids() -> tuple[str, ...]:
+    return tuple(_icu.Transliterator.getAvailableIDs())
+
+@_lru_cache(maxsize=1)
+def _transliterator_ids() -> frozenset[str]:
+    return frozenset(_available_transliterator_ids())
+
+def refresh_transliterator_ids() -> None:
+    """Refresh the cached transliterator IDs.
+
+    Call after registering transliterators directly with ICU, so that
+    available_transliterator_ids() and is_transliterator_id() include them.
+
+    Returns:
+        None:
+    """
+    _available_transliterator_ids.cache_clear()
+    _transliterator_ids.cache_clear()
+
+def available_transliterator_ids() -> list[str]:
+    """List the transliterator IDs available to ICU.
+
+    Returns:
+        list[str]: Transliterator IDs, in ICU's order.
+    """
+    return list(_available_transliterator_ids())
+
+def is_transliterator_id(id: str) -> bool:
+    """Test whether a transliterator ID is available to ICU.
+
+    The available IDs are cached. On a miss the cache is refreshed, so that
+    transliterators registered after the first lookup are found.
+
+    Args:
+        id (str): Transliterator ID.
+
+    Returns:
+        bool: True if the ID is available, otherwise False.
+    """
+    if id in _transliterator_ids():
+        return True
+    refresh_transliterator_ids()
+    return id in _transliterator_ids()
+
+@_lru_cache(maxsize=128)
+def get_transliterator(id: str, direction: int = _icu.UTransDirection.FORWARD) -> _icu.Transliterator:
+    """Retrieve a cached ICU transliterator instance.
+
+    Args:
+        id (str): Transliterator ID.
+        direction (int, optional): Direction of transformation. Defaults to _icu.UTransDirection.FORWARD.
+
+    Returns:
+        _icu.Transliterator: Transliterator instance.
+    """
+    return _icu.Transliterator.createInstance(id, direction)
+
+# Normalizer2 instances are immutable, and can be shared.
+_nfd_normaliser = _icu.Normalizer2.getNFDInstance()
+_nfkd_normaliser = _icu.Normalizer2.getNFKDInstance()
+_nfc_normaliser = _icu.Normalizer2.getNFCInstance()
+_nfkc_normaliser = _icu.Normalizer2.getNFKCInstance()
+_nfkc_cf_normaliser = _icu.Normalizer2.getNFKCCasefoldInstance()
+
+_icu_normalisers = {
+    "NFC": _nfc_normaliser,
+    "NFD": _nfd_normaliser,
+    "NFKC": _nfkc_normaliser,
+    "NFKD": _nfkd_normaliser,
+    "NFKC_CF": _nfkc_cf_normaliser,
+    "NFKC_CASEFOLD": _nfkc_cf_normaliser
+}
+
+def _is_nfc_quick(text: str) -> bool:
+    # Code points below U+0300 have NFC_Quick_Check=Yes and canonical combining class 0,
+    # so strings made up only of them are already in NFC. ASCII strings are unchanged by all four forms.
+    return text.isascii() or max(text) < '\u0300'
+
+def _is_nfd_quick(text: str) -> bool:
+    # U+00C0 is the first code point with a canonical decomposition.
+    return text.isascii() or max(text) < '\u00C0'
+
 def toNFD(text, use_icu=False):
+    if text.isascii():
+        return text
     if use_icu:
-        normaliser = _icu.Normalizer2.getNFDInstance()
-        return normaliser.normalize(text)
+        return _nfd_normaliser.normalize(text)
     return _unicodedataplus.normalize("NFD", text)
 NFD = toNFD
 
 def toNFKD(text, use_icu=False):
+    if text.isascii():
+        return text
     if use_icu:
-        normaliser = _icu.Normalizer2.getNFKDInstance()
-        return normaliser.normalize(text)
+        return _nfkd_normaliser.normalize(text)
     return _unicodedataplus.normalize("NFKD", text)
 NFKD = toNFKD
 
 def toNFC(text, use_icu=False):
+    if _is_nfc_quick(text):
+        return text
     if use_icu:
-        normaliser = _icu.Normalizer2.getNFCInstance()
-        return normaliser.normalize(text)
+        return _nfc_normaliser.normalize(text)
     return _unicodedataplus.normalize("NFC", text)
 NFC = toNFC
 
 def toNFKC(text, use_icu=False):
+    if text.isascii():
+        return text
     if use_icu:
-        normaliser = _icu.Normalizer2.getNFKCInstance()
-        return normaliser.normalize(text)
+        return _nfkc_normaliser.normalize(text)
     return _unicodedataplus.normalize("NFKC", text)
 NFKC = toNFKC
 
+_default_ignorable_pattern = _regex.compile(r"\p{Default_Ignorable_Code_Point=Yes}")
+
 def toNFKC_Casefold(text, use_icu=False):
+    # ASCII has no default ignorables or compatibility mappings.
+    if text.isascii():
+        return text.lower()
     if use_icu:
-        normaliser = _icu.Normalizer2.getNFKCCasefoldInstance()
-        return normaliser.normalize(text)
-    pattern = _regex.compile(r"\p{Default_Ignorable_Code_Point=Yes}")
-    text = _regex.sub(pattern, '', text)
-    return _unicodedataplus.normalize("NFC", _unicodedataplus.normalize('NFKC', text).casefold())
+        return _nfkc_cf_normaliser.normalize(text)
+    # Only strip default ignorables, and only normalise, when the quick checks require it.
+    if _default_ignorable_pattern.search(text):
+        text = _default_ignorable_pattern.sub('', text)
+    if not _unicodedataplus.is_normalized("NFKC", text):
+        text = _unicodedataplus.normalize("NFKC", text)
+    text = text.casefold()
+    if _unicodedataplus.is_normalized("NFC", text):
+        return text
+    return _unicodedataplus.normalize("NFC", text)
 NFKC_CF = toNFKC_Casefold
 
 def toCasefold(text: str, use_icu: bool = True, turkic: bool = False) -> str:
-    if use_icu:
+    if use_icu and (turkic or not text.isascii()):
         option: int = 1 if turkic else 0
         # return str(_icu.UnicodeString(text).foldCase(option))
         return _icu.CaseMap.fold(option, text)
@@ -520,6 +740,12 @@ fold_case = toCasefold
 
 # Replace values matching dictionary keys with values
 def replace_all(text, pattern_dict):
+    # Single character keys are replaced in one pass, unless a replacement
+    # contains a key, since sequential replacement would then act on it again.
+    if all(len(key) == 1 for key in pattern_dict):
+        table = {ord(key): str(value) for key, value in pattern_dict.items()}
+        if frozenset(pattern_dict).isdisjoint("".join(table.values())):
+            return text.translate(table)
     for key in pattern_dict.keys():
         text = text.replace(key, str(pattern_dict[key]))
     return text
@@ -528,104 +754,169 @@ def replace_all(text, pattern_dict):
 # nf = NFC | NFKC | NFKC_CF | NFD | NFKD | NFM21
 # NFM21: Normalise strings according to MARC21 Character repetoire requirements
 
+_hangul_pattern = _regex.compile(r'\p{Hangul}')
+_hangul_only_pattern = _regex.compile(r'(^\p{Hangul}+$)')
+_hangul_run_pattern = _regex.compile(r'\p{Hangul}+')
+
 def is_hangul(s):
-    return bool(_regex.search(r'(^\p{Hangul}+$)', s))
+    return bool(_hangul_only_pattern.search(s))
 def normalise_hangul(s, normalisation_form = "NFC"):
     if is_hangul(s):
         return _unicodedataplus.normalize(normalisation_form, s)
     else:
         return s
+def _nfc_match(match):
+    return _unicodedataplus.normalize("NFC", match.group())
 def marc_hangul(text):
-    return "".join(list(map(normalise_hangul, _regex.split(r'(\P{Hangul})', text))))
+    return _hangul_run_pattern.sub(_nfc_match, text)
+
+# Sequences that differ between NFD and the MARC21 normalisation form
+# Latin variations between NFD and MNF
+_marc21_latn_rep = {
+    "\u004F\u031B": "\u01A0",
+    "\u006F\u031B": "\u01A1",
+    "\u0055\u031B": "\u01AF",
+    "\u0075\u031B": "\u01B0"
+}
+# Cyrillic variations between NFD and MNF
+_marc21_cyrl_rep = {
+    "\u0418\u0306": "\u0419",
+    "\u0438\u0306": "\u0439",
+    "\u0413\u0301": "\u0403",
+    "\u0433\u0301": "\u0453",
+    "\u0415\u0308": "\u0401",
+    "\u0435\u0308": "\u0451",
+    "\u0406\u0308": "\u0407",
+    "\u0456\u0308": "\u0457",
+    "\u041A\u0301": "\u040C",
+    "\u043A\u0301": "\u045C",
+    "\u0423\u0306": "\u040E",
+    "\u0443\u0306": "\u045E"
+}
+# Arabic variations between NFD and MNF
+_marc21_arab_rep = {
+    "\u0627\u0653": "\u0622",
+    "\u0627\u0654": "\u0623",
+    "\u0648\u0654": "\u0624",
+    "\u0627\u0655": "\u0625",
+    "\u064A\u0654": "\u0626"
+}
+_marc21_rep = {**_marc21_latn_rep, **_marc21_cyrl_rep, **_marc21_arab_rep}
+_marc21_pattern = _regex.compile("|".join(map(_regex.escape, _marc21_rep)))
+# Combining marks that end each MARC21 sequence, used to skip the regex
+_marc21_marks = frozenset(key[-1] for key in _marc21_rep)
+
+def _marc21_replace(match):
+    return _marc21_rep[match.group()]
+
+# MNF (Marc Normalisation Form)
+def _marc21_normalise(text):
+    # Text that is already NFD and has no combining marks or Hangul is unchanged.
+    if _is_nfd_quick(text):
+        return text
+    # Normalise to NFD
+    text = _unicodedataplus.normalize("NFD", text)
+    # Replace all MARC21 sequences in a single pass
+    if not _marc21_marks.isdisjoint(text):
+        text = _marc21_pattern.sub(_marc21_replace, text)
+    if _hangul_pattern.search(text):
+        text = marc_hangul(text)
+    return text
+
+_nfm21_transform_id = "toNFM21"
+_nfm21_rules = (":: NFD; "
+    ":: [\\p{Hangul}] NFC ; "
+    "\u004F\u031B > \u01A0 ; \u008F\u031B > \u01A1 ; \u0055\u031B > \u01AF ; \u0075\u031B > \u01B0 ; "
+    "\u0415\u0308 > \u0401 ; \u0435\u0308 > \u0451 ; \u0413\u0301 > \u0403 ; \u0433\u0301 > \u0453 ; "
+    "\u0406\u0308 > \u0407 ; \u0456\u0308 > \u0457 ; \u041A\u0301 > \u040C ; \u043A\u0301 > \u045C ; "
+    "\u0423\u0306 > \u040E ; \u0443\u0306 > \u045E ; \u0418\u0306 > \u0419 ; \u0438\u0306 > \u0439 ; "
+    "\u0627\u0653 > \u0622 ; \u0627\u0654 > \u0623 ; \u0648\u0654 > \u0624 ; \u0627\u0655 > \u0625 ; "
+    "\u064A\u0654 > \u0626 ; ")
 
 def normalise(nf, text, use_icu=False):
     nf = nf.upper()
     if nf not in ["NFC", "NFKC", "NFKC_CF", "NFD", "NFKD", "NFM21"]:
         nf="NFC"
-    # MNF (Marc Normalisation Form)
-    def marc21_normalise(text):
-        # Normalise to NFD
-        text = _unicodedataplus.normalize("NFD", text)
-        # Latin variations between NFD and MNF
-        latn_rep = {
-            "\u004F\u031B": "\u01A0",
-            "\u006F\u031B": "\u01A1",
-            "\u0055\u031B": "\u01AF",
-            "\u0075\u031B": "\u01B0"
-        }
-        # Cyrillic variations between NFD and MNF
-        cyrl_rep = {
-            "\u0418\u0306": "\u0419",
-            "\u0438\u0306": "\u0439",
-            "\u0413\u0301": "\u0403",
-            "\u0433\u0301": "\u0453",
-            "\u0415\u0308": "\u0401",
-            "\u0435\u0308": "\u0451",
-            "\u0406\u0308": "\u0407",
-            "\u0456\u0308": "\u0457",
-            "\u041A\u0301": "\u040C",
-            "\u043A\u0301": "\u045C",
-            "\u0423\u0306": "\u040E",
-            "\u0443\u0306": "\u045E"
-        }
-        # Arabic variations between NFD and MNF
-        arab_rep = {
-            "\u0627\u0653": "\u0622",
-            "\u0627\u0654": "\u0623",
-            "\u0648\u0654": "\u0624",
-            "\u0627\u0655": "\u0625",
-            "\u064A\u0654": "\u0626"
-        }
-        # Only process strings containing characters that need replacing
-        if bool(_regex.search(r'[ouOU]\u031B', text)):
-            text = replace_all(text, latn_rep)
-        if bool(_regex.search(r'[\u0413\u041A\u0433\u043A]\u0301|[\u0418\u0423\u0438\u0443]\u0306|[\u0406\u0415\u0435\u0456]\u0308', text)):
-            text = replace_all(text, cyrl_rep)
-        if bool(_regex.search(r'[\u0627\u0648\u064A]\u0654|\u0627\u0655|\u0627\u0653', text)):
-            text = replace_all(text, arab_rep)
-        if bool(_regex.search(r'\p{Hangul}', text)):
-            text = marc_hangul(text)
-        return text
     if nf == "NFM21":
         if use_icu:
-            transform_id = "toNFM21"
-            nfm21_rules = (":: NFD; "
-                ":: [\\p{Hangul}] NFC ; "
-                "\u004F\u031B > \u01A0 ; \u008F\u031B > \u01A1 ; \u0055\u031B > \u01AF ; \u0075\u031B > \u01B0 ; "
-                "\u0415\u0308 > \u0401 ; \u0435\u0308 > \u0451 ; \u0413\u0301 > \u0403 ; \u0433\u0301 > \u0453 ; "
-                "\u0406\u0308 > \u0407 ; \u0456\u0308 > \u0457 ; \u041A\u0301 > \u040C ; \u043A\u0301 > \u045C ; "
-                "\u0423\u0306 > \u040E ; \u0443\u0306 > \u045E ; \u0418\u0306 > \u0419 ; \u0438\u0306 > \u0439 ; "
-                "\u0627\u0653 > \u0622 ; \u0627\u0654 > \u0623 ; \u0648\u0654 > \u0624 ; \u0627\u0655 > \u0625 ; "
-                "\u064A\u0654 > \u0626 ; ")
-            transform_direction = _icu.UTransDirection.FORWARD
-            register_transformation(transform_id, nfm21_rules, transform_direction)
-            transformer = _icu.Transliterator.createInstance(transform_id, transform_direction)
-            return transformer.transliterate(text)
+            register_transformation(_nfm21_transform_id, _nfm21_rules, _icu.UTransDirection.FORWARD)
+            return get_transliterator(_nfm21_transform_id).transliterate(text)
         else:
-            return marc21_normalise(text)
-    elif nf == "NFKC_CF":
-        if use_icu:
-            normaliser = _icu.Normalizer2.getNFKCCasefoldInstance()
-        else:
-            return toNFKC_Casefold(text)
-    elif nf == "NFC" and use_icu:
-        normaliser = _icu.Normalizer2.getNFCInstance()
-    elif nf == "NFKC" and use_icu:
-        normaliser = _icu.Normalizer2.getNFKCInstance()
-    elif nf == "NFD" and use_icu:
-        normaliser = _icu.Normalizer2.getNFDInstance()
-    elif nf == "NFKD" and use_icu:
-        normaliser = _icu.Normalizer2.getNFKDInstance()
+            return _marc21_normalise(text)
+    elif nf == "NFKC_CF" and not use_icu:
+        return toNFKC_Casefold(text)
+    elif nf == "NFC" and _is_nfc_quick(text):
+        return text
+    elif nf != "NFKC_CF" and text.isascii():
+        return text
     if use_icu:
-        return normaliser.normalize(text)
+        return _icu_normalisers[nf].normalize(text)
     return _unicodedataplus.normalize(nf, text)
 
+####################
+#
+# Batch processing
+#   Spread independent strings across worker processes.
+#
+####################
+
+def _batch_chunksize(texts: list[str], workers: int | None) -> int:
+    return max(1, len(texts) // (4 * (workers or _os.cpu_count() or 1)))
+
+def normalise_batch(nf: str, texts: list[str], use_icu: bool = False, workers: int | None = None) -> list[str]:
+    """Normalise a list of strings, using a pool of worker processes.
+
+    Args:
+        nf (str): Normalisation form, as used by normalise().
+        texts (list[str]): Strings to normalise.
+        use_icu (bool, optional): Use ICU for normalisation. Defaults to False.
+        workers (int | None, optional): Number of worker processes. Defaults to None, i.e. number of CPUs.
+
+    Returns:
+        list[str]: Normalised strings, in the same order as texts.
+    """
+    texts = list(texts)
+    with _ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_partial(normalise, nf, use_icu=use_icu), texts, chunksize=_batch_chunksize(texts, workers)))
+
+normalize_batch = normalise_batch
+
+def count_ngraphs_batch(texts: list[str], ngram_length: int = 2, workers: int | None = None) -> _Counter:
+    """Count ngraphs across a list of strings, using a pool of worker processes.
+
+    Args:
+        texts (list[str]): Strings to analyse.
+        ngram_length (int, optional): Size of ngraph. Defaults to 2.
+        workers (int | None, optional): Number of worker processes. Defaults to None, i.e. number of CPUs.
+
+    Returns:
+        Counter: Combined ngraph counts for all strings.
+    """
+    texts = list(texts)
+    total = _Counter()
+    with _ProcessPoolExecutor(max_workers=workers) as executor:
+        for counts in executor.map(_partial(count_ngraphs, ngram_length=ngram_length), texts, chunksize=_batch_chunksize(texts, workers)):
+            total.update(counts)
+    return total
+
 ####################
 #
 # Unicode matching
 #
 ####################
 
+# Match keys are cached for short strings, so repeated comparisons against
+# the same string only transform it once. Identical strings always match, so
+# the *_match functions return before computing any keys.
+@_lru_cache(maxsize=4096)
+def _cached_match_key(key, text, *args):
+    return key(text, *args)
+
+def _match_key(key, text, *args):
+    if type(text) is str and len(text) < MATCH_KEY_MAX_LENGTH:
+        return _cached_match_key(key, text, *args)
+    return key(text, *args)
+
 # Simple matching
 #   NFD(X) = NFD(Y)
 def simple_match(x, y, use_icu=False):
@@ -635,28 +926,69 @@ def simple_match(x, y, use_icu=False):
 #   toLower(NFD(X)) = toLower(NFD(Y))
 # TODO:
 #    add lowercaseing
+def _cased_key(text, use_icu):
+    return toNFD(text, use_icu=use_icu)
+
 def cased_match(x, y, use_icu=False):
-    return toNFD(x, use_icu=use_icu) == toNFD(y, use_icu=use_icu)
+    if x is y or x == y:
+        return True
+    return _match_key(_cased_key, x, use_icu) == _match_key(_cased_key, y, use_icu)
 
 # Caseless matching
 #   toCasefold(X) = toCasefold(Y)
+def _caseless_key(text, use_icu):
+    return toCasefold(text, use_icu=use_icu)
+
 def caseless_match(x, y, use_icu=False):
-    return toCasefold(x, use_icu=use_icu) == toCasefold(y, use_icu=use_icu)
+    if x is y or x == y:
+        return True
+    return _match_key(_caseless_key, x, use_icu) == _match_key(_caseless_key, y, use_icu)
 
 # Canonical caseless matching
 #   NFD(toCasefold(NFD(X))) = NFD(toCasefold(NFD(Y)))
+def _canonical_caseless_key(text, use_icu, turkic):
+    # ASCII is unchanged by decomposition, and only Turkic folding leaves ASCII.
+    if not turkic and text.isascii():
+        return text.lower()
+    text = toCasefold(toNFD(text, use_icu=use_icu), use_icu=use_icu, turkic=turkic)
+    # Case folding NFD text rarely denormalises it, so ICU only renormalises
+    # if the quick check fails.
+    if use_icu and _nfd_normaliser.isNormalized(text):
+        return text
+    return toNFD(text, use_icu=use_icu)
+
 def canonical_caseless_match(x, y, use_icu=False, turkic=False):
-    return toNFD(toCasefold(toNFD(x, use_icu=use_icu), use_icu=use_icu, turkic=turkic), use_icu=use_icu) == toNFD(toCasefold(toNFD(y, use_icu=use_icu), use_icu=use_icu, turkic=turkic), use_icu=use_icu)
+    if x is y or x == y:
+        return True
+    return _match_key(_canonical_caseless_key, x, use_icu, turkic) == _match_key(_canonical_caseless_key, y, use_icu, turkic)
 
 # Compatibility caseless match
 #   NFKD(toCasefold(NFKD(toCasefold(NFD(X))))) = NFKD(toCasefold(NFKD(toCasefold(NFD(Y)))))
+def _compatibility_caseless_key(text, use_icu, turkic):
+    if not turkic and text.isascii():
+        return text.lower()
+    text = toNFD(text, use_icu=use_icu)
+    text = toCasefold(text, use_icu=use_icu, turkic=turkic)
+    text = toNFKD(text, use_icu=use_icu)
+    text = toCasefold(text, use_icu=use_icu)
+    if use_icu and _nfkd_normaliser.isNormalized(text):
+        return text
+    return toNFKD(text, use_icu=use_icu)
+
 def compatibility_caseless_match(x, y, use_icu=False, turkic=False):
-    return toNFKD(toCasefold(toNFKD(toCasefold(toNFD(x, use_icu=use_icu), use_icu=use_icu, turkic=turkic), use_icu=use_icu), use_icu=use_icu), use_icu=use_icu) == toNFKD(toCasefold(toNFKD(toCasefold(toNFD(y, use_icu=use_icu), use_icu=use_icu, turkic=turkic), use_icu=use_icu), use_icu=use_icu), use_icu=use_icu)
+    if x is y or x == y:
+        return True
+    return _match_key(_compatibility_caseless_key, x, use_icu, turkic) == _match_key(_compatibility_caseless_key, y, use_icu, turkic)
 
 # Identifier caseless match for a string Y if and only if: 
 #   toNFKC_Casefold(NFD(X)) = toNFKC_Casefold(NFD(Y))`
+def _identifier_caseless_key(text, use_icu):
+    return toNFKC_Casefold(toNFD(text, use_icu=use_icu), use_icu=use_icu)
+
 def identifier_caseless_match(x, y, use_icu=False, turkic=False):
-    return toNFKC_Casefold(toNFD(x, use_icu=use_icu), use_icu=use_icu) == toNFKC_Casefold(toNFD(y, use_icu=use_icu), use_icu=use_icu)
+    if x is y or x == y:
+        return True
+    return _match_key(_identifier_caseless_key, x, use_icu) == _match_key(_identifier_caseless_key, y, use_icu)
 
 ####################
 #
@@ -671,20 +1003,23 @@ def multiple_replace(string, rep_dict):
 
 tr_tolower_replacements = {'I':'ı', 'İ':'i'}
 tr_toupper_replacements = {'ı':'I', 'i':'İ'}
+# Replacements are single characters, so are applied as translation tables.
+_tr_tolower_table = str.maketrans(tr_tolower_replacements)
+_tr_toupper_table = str.maketrans(tr_toupper_replacements)
 
 # To lowercase
 def trLower(text: str) -> str:
     text = normalise("NFC", text, use_icu=True)
-    return multiple_replace(text, tr_tolower_replacements).lower()
+    return text.translate(_tr_tolower_table).lower()
 
 def trCasefold(text: str) -> str:
     text = normalise("NFC", text, use_icu=True)
-    return multiple_replace(text, tr_tolower_replacements).casefold()
+    return text.translate(_tr_tolower_table).casefold()
 
 # To uppercase
 def trUpper(text:str) -> str:
     text = normalise("NFC", text, use_icu=True)
-    return multiple_replace(text, tr_toupper_replacements).upper()
+    return text.translate(_tr_toupper_table).upper()
 
 # To titlecase
 def trTitle(text: str) -> str:
@@ -710,15 +1045,25 @@ def trSentence(text: str) -> str:
 #
 ####################
 
+# ICU and Python case mappings agree on ASCII text, except for the dotted and
+# dotless i of Turkic languages, which a translation table handles. ICU is
+# only called for non-ASCII text.
+_turkic_lower = str.maketrans({'I': '\u0131'})
+_turkic_upper = str.maketrans({'i': '\u0130'})
+
 def toLower(text: str, use_icu: bool = True, loc=_icu.Locale.getRoot()) -> str:
     if not use_icu:
         return text.lower()
+    if text.isascii():
+        return text.translate(_turkic_lower).lower() if loc.getLanguage() in TURKIC else text.lower()
     # return str(_icu.UnicodeString(text).toLower(loc))
     return _icu.CaseMap.toLower(loc, text)
 
 def toUpper(text: str, use_icu: bool = True, loc=_icu.Locale.getRoot()) -> str:
     if not use_icu:
         return text.upper()
+    if text.isascii():
+        return text.translate(_turkic_upper).upper() if loc.getLanguage() in TURKIC else text.upper()
     # return str(_icu.UnicodeString(text).toUpper(loc))
     return _icu.CaseMap.toUpper(loc, text)
 
@@ -735,7 +1080,7 @@ def toSentence(text: str,  use_icu: bool = True, loc = _icu.Locale.getRoot()) ->
 
 capitalise = toSentence
 
-TURKIC = ["tr", "az"]
+TURKIC = frozenset({"tr", "az"})
 
 #
 # TODO:
@@ -744,7 +1089,7 @@ TURKIC = ["tr", "az"]
 # def toSentence(s, engine="core", lang="und"):
 #     # loc = _icu.Locale.forLanguageTag(lang)
 #     # lang = _regex.split('[_\-]', lang.lower())[0]
-#     lang = _regex.split(r'[_\-]', lang.lower())[0]
+#     lang = lang.lower().split('-', 1)[0].split('_', 1)[0]
 #     result = ""
 #     if (engine == "core") and (lang in TURKIC):
 #         result = buyukharfyap(s[0]) + kucukharfyap(s[1:])
@@ -761,7 +1106,7 @@ TURKIC = ["tr", "az"]
 
 # New verion of toSentence
 # def toSentence(s, lang="und", use_icu=False):
-#     lang_subtag = _regex.split('[_\-]', lang.lower())[0]
+#     lang_subtag = lang.lower().split('-', 1)[0].split('_', 1)[0]
 #     result = ""
 #     if not use_icu and lang_subtag in TURKIC:
 #         return buyukharfyap(s[0]) + kucukharfyap(s[1:])
@@ -798,8 +1143,10 @@ def remove_punctuation(text):
     result = text.translate(str.maketrans('', '', "".join(list(_icu.UnicodeSet(r'[\p{P}]')))))
     return " ".join(result.strip().split())
 
+_digits_pattern = _regex.compile(r"\d+([\u0020\u00A0\u202F]\d{3}|[\u066B\u066C,.'-]\d+)*")
+
 def remove_digits(text):
-    return _regex.sub(r"\d+([\u0020\u00A0\u202F]\d{3}|[\u066B\u066C,.'-]\d+)*", "", text).strip()
+    return _digits_pattern.sub("", text).strip()
 
 ####################
 #
@@ -808,11 +1155,41 @@ def remove_digits(text):
 #
 ####################
 
+_break_iterator_factories = {
+    "grapheme": _icu.BreakIterator.createCharacterInstance,
+    "sentence": _icu.BreakIterator.createSentenceInstance,
+    "word": _icu.BreakIterator.createWordInstance
+}
+
+# Break iterators hold iteration state, so cached instances are kept per thread.
+_thread_break_iterators = _threading.local()
+
+def _get_break_iterator(mode: str = "word", locale: _icu.Locale | None = None) -> _icu.BreakIterator:
+    """Retrieve a cached break iterator for the current thread.
+
+    Only use the iterator for calls that consume it fully before returning.
+
+    Args:
+        mode (str, optional): grapheme, sentence or word. Defaults to "word".
+        locale (_icu.Locale | None, optional): Locale for the break iterator. Defaults to None, i.e. the Root locale.
+
+    Returns:
+        _icu.BreakIterator: Break iterator instance.
+    """
+    if locale is None:
+        locale = _icu.Locale.getRoot()
+    cache = getattr(_thread_break_iterators, "cache", None)
+    if cache is None:
+        cache = _thread_break_iterators.cache = {}
+    key = (mode, locale.getName())
+    brkiter = cache.get(key)
+    if brkiter is None:
+        brkiter = cache[key] = _break_iterator_factories[mode](locale)
+    return brkiter
+
 def get_boundaries(text, brkiter):
     brkiter.setText(text)
-    boundaries = [*brkiter]
-    boundaries.insert(0, 0)
-    return boundaries
+    return [0, *brkiter]
 
 def tokenise(text, locale=_icu.Locale.getRoot(), mode="word"):
     """Tokenise a string based on locale: character, grapheme, word and sentense tokenisation supported.
@@ -825,17 +1202,15 @@ def tokenise(text, locale=_icu.Locale.getRoot(), mode="word"):
     Returns:
         _list_: list of tokens in string.
     """
-    match mode.lower():
-        case "character":
-            return list(text)
-        case "grapheme":
-            bi = _icu.BreakIterator.createCharacterInstance(locale)
-        case "sentence":
-            bi = _icu.BreakIterator.createSentenceInstance(locale)
-        case _:
-            bi = _icu.BreakIterator.createWordInstance(locale)
-    boundary_indices = get_boundaries(text, bi)
-    return [text[boundary_indices[i]:boundary_indices[i+1]] for i in range(len(boundary_indices)-1)]
+    mode = mode.lower()
+    if mode == "character":
+        return list(text)
+    if mode == "graphemes":
+        mode = "grapheme"
+    elif mode not in _break_iterator_factories:
+        mode = "word"
+    boundary_indices = get_boundaries(text, _get_break_iterator(mode, locale))
+    return [text[start:end] for start, end in _pairwise(boundary_indices)]
 
 tokenize = tokenise
 
@@ -850,7 +1225,7 @@ def tokenise_bi(text, brkiter):
         list: Tokens in string.
     """
     boundary_indices = get_boundaries(text, brkiter)
-    return [text[boundary_indices[i]:boundary_indices[i+1]] for i in range(len(boundary_indices)-1)]
+    return [text[start:end] for start, end in _pairwise(boundary_indices)]
 
 tokenize_bi = tokenise_bi
 
@@ -891,7 +1266,7 @@ def generate_tokens(text: str, brkiter: _icu.RuleBasedBreakIterator | None = Non
 
 
 def get_generated_tokens(text:str, bi: _icu.BreakIterator | None = None) -> list[str]:
-    """Create a list of tokens from a generator
+    """Create a list of tokens using a break iterator.
 
     Args:
         text (str): String to be tokenised.
@@ -901,7 +1276,35 @@ def get_generated_tokens(text:str, bi: _icu.BreakIterator | None = None) -> list
         list[str]: List of tokens based on specified break iterator.
     """
     #return [*gen_tokens(text, brkiter=bi)]
-    return list(generate_tokens(text, brkiter=bi))
+    return tokenise_bi(text, bi or _get_break_iterator("word"))
+
+def _tokenise_worker(text: str, mode: str, localeID: str | None) -> list[str]:
+    locale = _icu.Locale(localeID) if localeID else None
+    return tokenise_bi(text, _get_break_iterator(mode, locale))
+
+def tokenise_batch(texts: list[str], mode: str = "word", localeID: str | None = None, workers: int | None = None) -> list[list[str]]:
+    """Tokenise a list of strings, using a pool of worker processes.
+
+    Break iterators can not be passed between processes, so each worker
+    creates its own from the mode and locale ID.
+
+    Args:
+        texts (list[str]): Strings to tokenise.
+        mode (str, optional): Grapheme, word or sentence tokenisation to perform. Defaults to "word".
+        localeID (str | None, optional): Locale ID for tokenisation. Defaults to None, i.e. the Root locale.
+        workers (int | None, optional): Number of worker processes. Defaults to None, i.e. number of CPUs.
+
+    Returns:
+        list[list[str]]: List of tokens for each string, in the same order as texts.
+    """
+    mode = mode.lower()
+    if mode not in _break_iterator_factories:
+        mode = "word"
+    texts = list(texts)
+    with _ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_partial(_tokenise_worker, mode=mode, localeID=localeID), texts, chunksize=_batch_chunksize(texts, workers)))
+
+tokenize_batch = tokenise_batch
 
 ####################
 #
@@ -912,8 +1315,15 @@ def get_generated_tokens(text:str, bi: _icu.BreakIterator | None = None) -> list
 # def graphemes(text):
 #     return _regex.findall(r'\X',text)
 
-graphemes = _partial(tokenise, mode="grapheme")
-graphemes.__doc__ = """Grapheme tokenisation of string.
+@_lru_cache(maxsize=CACHE_MAX_ENTRIES)
+def _cached_graphemes(text: str, localeID: str) -> tuple[str, ...]:
+    locale = _icu.Locale(localeID) if localeID else None
+    return tuple(tokenise_bi(text, _get_break_iterator("grapheme", locale)))
+
+def graphemes(text, locale=_icu.Locale.getRoot()):
+    """Grapheme tokenisation of string.
+
+    Results for short strings are cached.
 
     Args:
         text (_str_): string to be tokenised
@@ -922,21 +1332,93 @@ graphemes.__doc__ = """Grapheme tokenisation of string.
     Returns:
         _list_: list of graphemes
     """
+    if type(text) is str and len(text) <= CACHE_MAX_LENGTH:
+        return list(_cached_graphemes(text, locale.getName()))
+    return tokenise(text, locale=locale, mode="grapheme")
+
 gr = graphemes
 
+def graphemes_take(text: str, n: int, locale: _icu.Locale | None = None) -> list[str]:
+    """First n graphemes of a string.
+
+    Stops tokenising once n graphemes have been found, rather than tokenising the whole string.
+
+    Args:
+        text (str): string to be tokenised.
+        n (int): maximum number of graphemes to return.
+        locale (_icu.Locale | None, optional): ICU locale to use in tokenisation. Defaults to None, i.e. the Root locale.
+
+    Returns:
+        list[str]: list of up to n graphemes.
+    """
+    brkiter = _get_break_iterator("grapheme", locale)
+    brkiter.setText(text)
+    boundaries = [0, *_islice(brkiter, n)]
+    return [text[start:end] for start, end in _pairwise(boundaries)]
+
 ####################
 #
 # ustr (ustring):
 #   Class for unicode compliant string operations.
 #
 ####################
+# Garay (Gara) to be added in Unicode v16
+# Zaghawa (Beria Giray Erfe) not in Unicode, preliminary proposal available, no script code.
+BICAMERAL_SCRIPTS = frozenset({'Adlam', 'Armenian', 'Cherokee', 'Coptic', 'Cyrillic', 'Deseret', 'Glagolitic', 'Greek', 'Old_Hungarian', 'Latin', 'Osage', 'Vithkuqi', 'Warang_Citi'})
+_bicameral_set = _icu.UnicodeSet('[' + ''.join(f'[:sc={script}:]' for script in sorted(BICAMERAL_SCRIPTS)) + ']')
+_bicameral_set.freeze()
+
+@_lru_cache(maxsize=128)
+def _binary_property_set(property: int) -> _icu.UnicodeSet:
+    # Frozen set of all code points with the binary property, for whole-string membership tests.
+    uset = _icu.UnicodeSet()
+    uset.applyIntPropertyValue(property, 1)
+    uset.freeze()
+    return uset
+
+# ICU's available locales are fixed when ICU is built, so are read once.
+_icu_locales = tuple(_icu.Locale.getAvailableLocales().keys())
+
+# Locale instances for locale IDs, shared between calls and treated as read only.
+_locale_instance = _lru_cache(maxsize=64)(_icu.Locale)
+
+# Locale IDs with special meaning for ustr methods.
+_named_locales = {
+    "root": _icu.Locale.getRoot,
+    "und": _icu.Locale.getRoot,
+    "default": _icu.Locale.getDefault
+}
+
+# Tokenisation modes for ustr methods. Other modes use word tokenisation.
+def _character_tokens(text: str, locale: _icu.Locale) -> list[str]:
+    return list(text)
+
+def _grapheme_tokens(text: str, locale: _icu.Locale) -> list[str]:
+    return graphemes(text)
+
+def _word_tokens(text: str, locale: _icu.Locale) -> list[str]:
+    return tokenise(text, locale=locale)
+
+_ustr_tokenisers = {
+    "character": _character_tokens,
+    "grapheme": _grapheme_tokens
+}
+
+# Sort token counts by descending frequency, then by token.
+def _frequency_sort_key(item: tuple[str, int]) -> tuple[int, str]:
+    return (-item[1], item[0])
+
+# Deprecated combining marks U+0340 and U+0341, excluded from canonical equivalents.
+_deprecated_marks = frozenset('\u0340\u0341')
+
 class ustr(_UserString):
     def __init__(self, string):
         self._initial = string
         self._locale = None
         self._nform = None
+        self._wcswidth = None
+        self._graphemes = None
         # self._unicodestring = _icu.UnicodeString(string)
-        # self._graphemes = graphemes(string)
         self.debug = False
         super().__init__(string)
 
@@ -947,29 +1429,32 @@ class ustr(_UserString):
         # return f'uString({self.data}, {self._initial}, {self._nform})'
         class_name = type(self).__name__
         limit = 100
-        truncated: str = f'{"".join(graphemes(self.data)[0:round(2*limit/3)])}…' if len(self.data) > limit else self.data
-        transformed: bool = True if self.data != self._initial else False
+        data = self.data
+        truncated: str = f'{"".join(graphemes_take(data, round(2*limit/3)))}…' if len(data) > limit else data
+        transformed: bool = True if data != self._initial else False
         return f"{class_name}(nform={self._nform}, locale={self._locale}, transformed={transformed}, string={truncated})"
 
     def _isbicameral(self):
-        # Garay (Gara) to be added in Unicode v16
-        # Zaghawa (Beria Giray Erfe) not in Unicode, preliminary proposal available, no script code.
-        bicameral_scripts = {'Adlam', 'Armenian', 'Cherokee', 'Coptic', 'Cyrillic', 'Deseret', 'Glagolitic', 'Greek', 'Old_Hungarian', 'Latin', 'Osage', 'Vithkuqi', 'Warang_Citi'}
-        scripts_in_text = set()
-        for char in self.data:
-            scripts_in_text.add(_unicodedataplus.script(char))
-        return True if bicameral_scripts & scripts_in_text else False
+        return _bicameral_set.containsSome(self.data)
 
     def _adjusted_width(self, n:int)->int:
+        # Terminal width is cached against the string it was calculated for, so
+        # mutators that leave the text unchanged keep the cached value.
         data = self.data
-        adjustment: int = len(data) - _wcswidth(data)
+        if self._wcswidth is None or self._wcswidth[0] != data:
+            self._wcswidth = (data, _wcswidth(data))
+        adjustment: int = len(data) - self._wcswidth[1]
         return n + adjustment
 
+    def _grapheme_tuple(self) -> tuple[str, ...]:
+        # Graphemes are segmented lazily, and cached against the string they were found in.
+        data = self.data
+        if self._graphemes is None or self._graphemes[0] != data:
+            self._graphemes = (data, tuple(graphemes(data)))
+        return self._graphemes[1]
+
     def _get_binary_property_value(self, property):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.hasBinaryProperty(char, property))
-        return all(status)
+        return _binary_property_set(property).containsAll(self.data)
 
     def _set_locale(self, locale = None):
         if locale:
@@ -978,15 +1463,8 @@ class ustr(_UserString):
             locale = self._locale
         else:
             self._locale = locale = "default"
-        match locale:
-            case "root":
-                return _icu.Locale.getRoot()
-            case "und":
-                return _icu.Locale.getRoot()
-            case "default":
-                return _icu.Locale.getDefault()
-            case _  :
-                return _icu.Locale(locale)
+        get_locale = _named_locales.get(locale)
+        return get_locale() if get_locale else _locale_instance(locale)
 
     def _set_parameters(self, new_data=None):
         if new_data:
@@ -1004,22 +1482,27 @@ class ustr(_UserString):
         return (VERSION, PYICU_VERSION, ICU_VERSION, ICU_UNICODE_VERSION, UD_VERSION)
 
     def available_locales(self):
-        return list(_icu.Locale.getAvailableLocales().keys())
+        return list(_icu_locales)
 
     def available_transforms(self):
-        return list(_icu.Transliterator.getAvailableIDs())
+        return available_transliterator_ids()
 
     def canonical_equivalents(self, verbose=False):
-        deprecated = _regex.compile(r'[\u0340\u0341]')
         # graphemes_list = gr(self.data)
         results = []
         results_cp = []
-        for grapheme in graphemes(self.data):
-            ci = _icu.CanonicalIterator(grapheme)
-            equivalents = [char for char in ci if not _regex.search(deprecated, char)]
-            equivalents_cp = [codepoints(chars, prefix=False) for chars in equivalents]
-            results_cp.append((grapheme, equivalents_cp))
-            results.append(equivalents)
+        # One iterator is reset for each distinct grapheme, repeated graphemes reuse earlier results.
+        ci = _icu.CanonicalIterator("")
+        found = {}
+        for grapheme in self._grapheme_tuple():
+            equivalents = found.get(grapheme)
+            if equivalents is None:
+                ci.setSource(grapheme)
+                equivalents = found[grapheme] = tuple(char for char in ci if _deprecated_marks.isdisjoint(char))
+            if verbose:
+                results_cp.append((grapheme, [codepoints(chars, prefix=False) for chars in equivalents]))
+            else:
+                results.append(list(equivalents))
         if verbose:
             return results_cp
         return results
@@ -1050,14 +1533,16 @@ class ustr(_UserString):
     ci = casefold
 
     # Canonical case-insensitive
+    #   NFD(toCasefold(NFD(X))), which is not equivalent to NFKC_Casefold.
     def cci(self, turkic=False):
-        self.data = toNFD(toCasefold(toNFD(self.data, use_icu=True), use_icu=True, turkic = turkic), use_icu=True)
+        # Same transformation as the canonical caseless match key, including its fast paths.
+        self.data = _canonical_caseless_key(self.data, True, turkic)
         self._set_parameters()
         return self
 
     def center(self, width: int, fillchar:str = " ") -> str:
         data = self.data
-        return data.center(self._adjusted_width(width, data), fillchar)
+        return data.center(self._adjusted_width(width), fillchar)
 
     centre = center
 
@@ -1071,9 +1556,8 @@ class ustr(_UserString):
     def count(self, sub, start=None, end=None, use__regex=False, overlapping=False):
         text = self.data
         if use__regex:
-            pattern = f'(?=({sub}))' if overlapping else sub
-            text = text[start:end] if not start and not end else text
-            return len(_regex.findall(pattern, text))
+            pattern = _compile_pattern(f'(?=({sub}))' if overlapping else sub)
+            return sum(1 for _ in pattern.finditer(text[start:end]))
         return text.count(sub, start, end)
 
     def dominant_direction(self):
@@ -1100,7 +1584,7 @@ class ustr(_UserString):
 
     def fullwidth(self):
         # return _icu.Transliterator.createInstance('Halfwidth-Fullwidth').transliterate(self.data)
-        self.data = _icu.Transliterator.createInstance('Halfwidth-Fullwidth').transliterate(self.data)
+        self.data = get_transliterator('Halfwidth-Fullwidth').transliterate(self.data)
         self._set_parameters()
         return self
 
@@ -1111,87 +1595,60 @@ class ustr(_UserString):
         return self.data
 
     def graphemes(self):
-        return graphemes(self.data)
+        return list(self._grapheme_tuple())
 
     def grapheme_length(self):
-        return len(graphemes(self.data))
+        return len(self._grapheme_tuple())
 
     def halfwidth(self):
         # return _icu.Transliterator.createInstance('Fullwidth-Halfwidth').transliterate(self.data)
-        self.data = _icu.Transliterator.createInstance('Fullwidth-Halfwidth').transliterate(self.data)
+        self.data = get_transliterator('Fullwidth-Halfwidth').transliterate(self.data)
         self._set_parameters()
         return self
 
     # index - from UserString
 
     def isalnum(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isalnum(char))
-        return all(status)
+        return all(map(_icu.Char.isalnum, self.data))
 
     def isalpha_posix(self):
         # Determines whether the specified code point is a letter character.
         # True for general categories "L" (letters).
         # Same as java.lang.Character.isLetter().
         # Serves as a C/POSIX migration function.
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isalpha(char))
-        return all(status)
+        return all(map(_icu.Char.isalpha, self.data))
 
     def isalpha(self):
         # Check if a code point has the Alphabetic Unicode property.
         # Same as u_hasBinaryProperty(c, UCHAR_ALPHABETIC). This is different from u_isalpha!
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isUAlphabetic(char))
-        return all(status)
+        return self._get_binary_property_value(_icu.UProperty.ALPHABETIC)
 
     def isascii(self):
         data = self.data
         return data.isascii()
 
     def isbase(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isbase(char))
-        return all(status)
+        return all(map(_icu.Char.isbase, self.data))
 
     def isbidi(self):
         return is_bidi(self.data)
 
     def isblank(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isblank(char))
-        return all(status)
+        return all(map(_icu.Char.isblank, self.data))
 
     def iscntrl(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.iscntrl(char))
-        return all(status)
+        return all(map(_icu.Char.iscntrl, self.data))
 
     # isdecimal - from UserString
 
     def isdefined(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isdefined(char))
-        return all(status)
+        return all(map(_icu.Char.isdefined, self.data))
 
     def isdigit(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isdigit(char))
-        return all(status)
+        return all(map(_icu.Char.isdigit, self.data))
 
     def isgraph(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isgraph(char))
-        return all(status)
+        return all(map(_icu.Char.isgraph, self.data))
 
     def isidentifier(self):
         data = self.data
@@ -1202,41 +1659,26 @@ class ustr(_UserString):
         # This misses some characters that are also lowercase but have a different general category value. 
         # In order to include those, use UCHAR_LOWERCASE.
         # This is a C/POSIX migration function.
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.islower(char))
-        return all(status)
+        return all(map(_icu.Char.islower, self.data))
 
     def islower(self):
         # Check if a code point has the Lowercase Unicode property. 
         # Same as u_hasBinaryProperty(c, UCHAR_LOWERCASE). This is different from _icu.Char.islower! 
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isULowercase(char))
-        return all(status)
+        return self._get_binary_property_value(_icu.UProperty.LOWERCASE)
 
     def ismirrored(self):
         # Determines whether the code point has the Bidi_Mirrored property.
         # This property is set for characters that are commonly used in Right-To-Left contexts 
         # and need to be displayed with a "mirrored" glyph.
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isMirrored(char))
-        return all(status)
+        return self._get_binary_property_value(_icu.UProperty.BIDI_MIRRORED)
 
     # isnumeric - from UserString
 
     def isprintable(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isprint(char))
-        return all(status)
+        return all(map(_icu.Char.isprint, self.data))
 
     def ispunct(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.ispunct(char))
-        return all(status)
+        return all(map(_icu.Char.ispunct, self.data))
 
     def isscript(self , script:str , common:bool=False) -> bool:
         return isScript(self.data, script=script, common=common)
@@ -1245,10 +1687,7 @@ class ustr(_UserString):
         # Determines if the specified character is a space character or not. 
         # Note: There are several ICU whitespace functions;
         # This is a C/POSIX migration function.
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isspace(char))
-        return all(status)
+        return all(map(_icu.Char.isspace, self.data))
 
     isspace = isspace_posix
 
@@ -1256,28 +1695,18 @@ class ustr(_UserString):
         loc = self._set_locale(locale)
         if not self._isbicameral():
             return False
-        words = self.data.split()
-        words_status = []
-        for word in words:
-            words_status.append(True) if word == str(_icu.UnicodeString(word).toTitle(loc)) else words_status.append(False)
-        return all(words_status)
+        return all(word == toTitle(word, True, loc) for word in self.data.split())
 
     def isupper_posix(self):
         # Determines whether the specified code point has the general category "Lu" (uppercase letter).
         # This misses some characters that are also uppercase but have a different general category value. In order # to include those, use UCHAR_UPPERCASE.
         # This is a C/POSIX migration function.
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isupper(char))
-        return all(status)
+        return all(map(_icu.Char.isupper, self.data))
 
     def isupper(self):
         # Check if a code point has the Uppercase Unicode property.
         # Same as u_hasBinaryProperty(c, UCHAR_UPPERCASE). This is different from u_isupper!
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isUUppercase(char))
-        return all(status)
+        return self._get_binary_property_value(_icu.UProperty.UPPERCASE)
 
     def iswhitespace(self):
         # Determines if the specified code point is a whitespace character according to Java/ICU. 
@@ -1292,31 +1721,22 @@ class ustr(_UserString):
         #     * It is U+001D GROUP SEPARATOR.
         #     * It is U+001E RECORD SEPARATOR.
         #     * It is U+001F UNIT SEPARATOR.
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isWhitespace(char))
-        return all(status)
+        return all(map(_icu.Char.isWhitespace, self.data))
 
     def iswhitespaceU(self):
         # Check if a code point has the White_Space Unicode property.
         # Same as u_hasBinaryProperty(c, UCHAR_WHITE_SPACE).
         # This is different from both u_isspace and u_isWhitespace!
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isUWhiteSpace(char))
-        return all(status)
+        return self._get_binary_property_value(_icu.UProperty.WHITE_SPACE)
 
     def isxdigit(self):
-        status = []
-        for char in [char for char in self.data]:
-            status.append(_icu.Char.isxdigit(char))
-        return all(status)
+        return all(map(_icu.Char.isxdigit, self.data))
 
     # join - from UserString
 
     def ljust(self, width: int, fillchar:str = " ") -> str:
         data = self.data
-        return data.ljust(self._adjusted_width(width, data), fillchar)
+        return data.ljust(self._adjusted_width(width), fillchar)
 
     def lower(self, locale = "default"):
         # return str(_icu.UnicodeString(self.data).toLower(_icu.Locale(locale))) if locale else str(_icu.UnicodeString(self.data).toLower())
@@ -1352,20 +1772,10 @@ class ustr(_UserString):
         else:
             self._nform = nform = "NFD"
         if use_icu:
-            match nform:
-                case 'NFC':
-                    self.data = _icu.Normalizer2.getNFCInstance().normalize(self.data)
-                case 'NFKC':
-                    self.data = _icu.Normalizer2.getNFKCInstance().normalize(self.data)
-                case 'NFKD':
-                    self.data = _icu.Normalizer2.getNFKDInstance().normalize(self.data)
-                case "NFKC_CASEFOLD":
-                    self.data = _icu.Normalizer2.getNFKCCasefoldInstance().normalize(self.data)
-                case _:
-                    self.data = _icu.Normalizer2.getNFDInstance().normalize(self.data)
+            self.data = _icu_normalisers.get(nform, _nfd_normaliser).normalize(self.data)
         else:
-            if nform == "NFKC_CASEFOLD" or "NFKC_CF":
-                self.data = _unicodedataplus.normalize("NFC", _unicodedataplus.normalize('NFKC', self.data).casefold())
+            if nform in ("NFKC_CASEFOLD", "NFKC_CF"):
+                self.data = toNFKC_Casefold(self.data)
             else:
                 self.data = _unicodedataplus.normalize(nform, self.data)
         # self._unicodestring = _icu.UnicodeString(self.data)
@@ -1379,8 +1789,9 @@ class ustr(_UserString):
     # removesuffix - from UserString
 
     def remove_stopwords(self, stopwords):
-        filtered_tokens = [word for word in self.data.split() if not word in stopwords]
-        self.data = ' '.join(filtered_tokens)
+        if not isinstance(stopwords, (set, frozenset)):
+            stopwords = frozenset(stopwords)
+        self.data = ' '.join(word for word in self.data.split() if word not in stopwords)
         self._set_parameters()
         return self
 
@@ -1392,7 +1803,7 @@ class ustr(_UserString):
             count = 0
         data = self.data
         if use__regex:
-            result = _regex.sub(old, new, data, count, flags) if flags else _regex.sub(old, new, data, count)
+            result = _compile_pattern(old, flags).sub(new, data, count)
         else:
             result = data.replace(old, new, count)
         self._set_parameters(result)
@@ -1407,30 +1818,34 @@ class ustr(_UserString):
 
     def rjust(self, width: int, fillchar:str = " ") -> str:
         data = self.data
-        return data.rjust(self._adjusted_width(width, data), fillchar)
+        return data.rjust(self._adjusted_width(width), fillchar)
 
     # rpartition - from UserString
 
     def rsplit(self, sep=None, maxsplit=-1, flags=0):
         text = self.data
         # Adapted from https://stackoverflow.com/questions/38953278/what-s-the-equivalent-of-rsplit-with-re-split
-        if maxsplit == 0 or not _regex.search(sep, text):
+        if maxsplit == 0:
             return [text]
-        if maxsplit == -1:
-            maxsplit = 0
+        if maxsplit < 0:
+            maxsplit = None
         if not sep:
             sep = r'\p{whitespace}'
+        # Scan from the end of the string, so overlapping separators resolve from the right
+        # with or without a limit; with a limit, only the last maxsplit matches are needed.
+        if isinstance(sep, _regex.Pattern):
+            sep, flags = sep.pattern, sep.flags | flags
+        spans = [m.span() for m in _islice(_compile_pattern(sep, flags | _regex.REVERSE).finditer(text), maxsplit)]
+        if not spans:
+            return [text]
         prev = len(text)                             # Previous match value start position
-        cnt = 0                                      # A match counter
-        result = []                                  # Output list
-        for m in reversed(list(_regex.finditer(sep, text, flags=flags))):
-            result.append(text[m.end():prev])        # Append a match to resulting list
-            prev = m.start()                         # Set previous match start position
-            cnt += 1                                 # Increment counter
-            if maxsplit > 0 and cnt >= maxsplit:     # Break out of for loop if maxsplit is greater than 0 and...
-                break                                # ...match count is more or equals max split value
+        result = []                                  # Output list, built from the end of the string
+        for match_start, match_end in spans:
+            result.append(text[match_end:prev])
+            prev = match_start
         result.append(text[:prev])                   # Append the text chunk from start
-        return reversed(result)                      # Return reversed list```
+        result.reverse()
+        return result
 
     # TODO: add optional _regex support
     def rstrip(self, chars=None):
@@ -1443,13 +1858,14 @@ class ustr(_UserString):
         # This implementation uses _regex.split(), but uses the maxsplit logic of str.split()
         # in order to keep API compatible.
         # To get python interpretation of whitespace, use the pattern r'[\p{whitespace}\u001C\u001D\u001E\u001F]'
+        data = self.data
         if maxsplit == 0:
-            return [self.data]
-        if maxsplit == -1:
-            maxsplit = 0
+            return [data]
+        if maxsplit < 0:
+            maxsplit = None
         if not sep:
             sep = r'\p{whitespace}'
-        return _regex.split(sep, self.data, maxsplit, flags)
+        return _compile_pattern(sep, flags).split(data, maxsplit)
 
     # splitlines - from UserString
     # startswith - from UserString
@@ -1462,7 +1878,10 @@ class ustr(_UserString):
 
     def swap(self, s1, s2, temp ='\U0010FFFD'):
         data = self.data
-        result =  data.replace(s1, temp).replace(s2, s1).replace(temp, s2)
+        if len(s1) == 1 and len(s2) == 1:
+            result = data.translate({ord(s1): s2, ord(s2): s1})
+        else:
+            result = data.replace(s1, temp).replace(s2, s1).replace(temp, s2)
         self._set_parameters(result)
         return self
 
@@ -1478,33 +1897,21 @@ class ustr(_UserString):
     def token_frequencies(self, mode="word", locale="default"):
         # Frequencies of character, grapheme, or word tokens in uString object
         loc = self._set_locale(locale)
-        tokens = []
-        data = self.data
-        match mode:
-            case "character":
-                tokens = [c for c in data]
-            case "grapheme":
-                tokens = graphemes(data)
-            case _:
-                tokens = tokenise(data, locale=loc)
-        counts = _Counter(tokens)
-        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        # Characters and graphemes are counted without building a token list.
+        if mode == "character":
+            counts = _Counter(self.data)
+        elif mode == "grapheme":
+            counts = _Counter(self._grapheme_tuple())
+        else:
+            counts = _Counter(_ustr_tokenisers.get(mode, _word_tokens)(self.data, loc))
+        return sorted(counts.items(), key=_frequency_sort_key)
 
     def tokenise(self, mode="word", locale="default", pattern=None):
         # Frequencies of character, grapheme, or word tokens in uString object
         loc = self._set_locale(locale)
-        tokens = []
-        data = self.data
-        match mode:
-            case "character":
-                tokens = [c for c in data]
-            case "grapheme":
-                tokens = graphemes(data)
-            case "_regex":
-                tokens = _regex.findall(pattern, data)
-            case _:
-                tokens = tokenise(data, locale=loc)
-        return tokens
+        if mode == "_regex":
+            return _regex.findall(pattern, self.data)
+        return _ustr_tokenisers.get(mode, _word_tokens)(self.data, loc)
 
     def transform(self, id_label: str | None, rules: str | None = None, reverse: bool = False) -> _Self:
         """Use _icu.Transliterator to 
@@ -1528,8 +1935,8 @@ class ustr(_UserString):
         direction = _icu.UTransDirection.REVERSE if reverse else _icu.UTransDirection.FORWARD
         if id_label is None and rules is None:
             return self
-        if id_label in list(_icu.Transliterator.getAvailableIDs()):
-            self.data = _icu.Transliterator.createInstance(id_label, direction).transliterate(self.data)
+        if is_transliterator_id(id_label):
+            self.data = get_transliterator(id_label, direction).transliterate(self.data)
         if rules and id_label is None:
             self.data = _icu.Transliterator.createFromRules("custom", rules, direction).transliterate(self.data)
         self._set_parameters()
@@ -1538,9 +1945,10 @@ class ustr(_UserString):
     # translate - from UserString
 
     def truncate(self, limit: int = 100, mode: str = "character") -> str:
+        data = self.data
         if mode == "grapheme":
-            return f'{"".join(graphemes(self.data)[0: limit])}…' if len(self.data) > limit else "".join(graphemes(self.data))
-        return f'{self.data[0:limit]}…' if len(self.data) > limit else self.data
+            return f'{"".join(self._grapheme_tuple()[0: limit])}…' if len(data) > limit else data
+        return f'{data[0:limit]}…' if len(data) > limit else data
 
     def udata(self):
         udata(self.data)
@@ -1696,6 +2104,12 @@ def ethiopian_to_gregorian(ethiopian_dt, time_zone = None):
 def gregorian_to_ethiopian(gregorian_dt, tz = None):
     pass
 
+_ethiopic_punctuation_rep = {'\u1361\u1361': '\u1362', '\u1361\u002D': '\u1366'}
+_ethiopic_punctuation_pattern = _regex.compile('\u1361[\u1361\u002D]')
+
+def _ethiopic_punctuation_replace(match):
+    return _ethiopic_punctuation_rep[match.group()]
+
 class EthiopicUstr(ustr):
     def __init__(self, string):
         self._initial = string
@@ -1708,8 +2122,7 @@ class EthiopicUstr(ustr):
         super().__init__(string)
 
     def clean_punctuation(self):
-        data = self.data
-        self.data = data.replace('\u1361\u1361', '\u1362').replace('\u1361\u002D', '\u1366')
+        self.data = _ethiopic_punctuation_pattern.sub(_ethiopic_punctuation_replace, self.data)
         self._set_parameters()
         return self
 
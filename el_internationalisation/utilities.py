@@ -1,5 +1,8 @@
 from typing import List as _List, Optional as _Optional
 import icu as _icu
+from functools import lru_cache as _lru_cache
+from collections import defaultdict as _defaultdict
+from heapq import merge as _heapq_merge
 from .ustrings import gr
 
 def list_to_string(items, sep = ', ', drop_bool = True):
@@ -19,8 +22,8 @@ def list_to_string(items, sep = ', ', drop_bool = True):
     """
     # return sep.join([item for item in items if item])
     if not drop_bool:
-        return sep.join(f'{item}' for item in items)
-    return sep.join(f'{item}' for item in items if item)
+        return sep.join(map(str, items))
+    return sep.join(map(str, filter(None, items)))
 
 def string_to_list(items, sep = ', '):
     """Convert string to list
@@ -38,7 +41,7 @@ def string_to_list(items, sep = ', '):
         list: _description_
     """
     # return [item.strip() for item in items.split(sep) if item.strip()]
-    return [item for item in items.split(sep) if item == item.strip() ]
+    return [item for item in map(str.strip, items.split(sep)) if item]
 
 def print_list(l, sep = "\n", drop_bool = True):
     """Print list to STDOUT
@@ -50,8 +53,8 @@ def print_list(l, sep = "\n", drop_bool = True):
         l (list): _description_
         sep (str, optional): _description_. Defaults to "\n".
     """
-    if sep == "\u0020":
-        print(list_to_string(l, sep=sep, drop_bool=drop_bool))
+    if sep == "\u0020" and drop_bool:
+        print(*filter(None, l), sep=sep)
     else:
         print(*l, sep=sep)
 
@@ -69,6 +72,48 @@ def search_dict_values(dictionary, searchString):
     """
     return [key for key,val in dictionary.items() if any(searchString in s for s in val)]
 
+class DictSearcher:
+    """Repeated substring searches of dictionary values
+
+    Joins the strings of each value once, and indexes their trigrams, so that
+    repeated searches of the same dictionary only scan the values of keys
+    sharing the query's trigrams. Returns the same keys as search_dict_values().
+    The index reflects the dictionary at the time the DictSearcher was created.
+
+    Attributes
+    ----------
+    dictionary: dict
+        Dictionary whose values are iterables of strings.
+
+    Methods
+    -------
+    search(searchString)
+        List of keys with a value containing _searchString_.
+    """
+
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self._keys = list(dictionary)
+        # NUL separates the strings of a value, so matches cannot span two of them.
+        self._values = ["\x00".join(val) for val in dictionary.values()]
+        self._index = _defaultdict(set)
+        for position, value in enumerate(self._values):
+            for i in range(len(value) - 2):
+                self._index[value[i:i + 3]].add(position)
+
+    def search(self, searchString):
+        if not searchString or "\x00" in searchString:
+            return search_dict_values(self.dictionary, searchString)
+        if len(searchString) < 3:
+            return [key for key, value in zip(self._keys, self._values) if searchString in value]
+        trigrams = {searchString[i:i + 3] for i in range(len(searchString) - 2)}
+        postings = sorted((self._index.get(t, set()) for t in trigrams), key=len)
+        candidates = set.intersection(*postings)
+        return [
+            self._keys[position] for position in sorted(candidates)
+            if searchString in self._values[position]
+        ]
+
 def search_dict_keys(dictionary, searchString):
     """Retrieve dictionary values for matching keys
 
@@ -95,14 +140,20 @@ def available_methods(clss: str, search_string: str | None = None, mode: str = "
     mode = "script" if mode.lower() != "cli" else "cli"
     methods: _List[str] = []
     if search_string:
-        methods = [item for item in list(dir(clss)) if search_string.lower() in item.lower()]
+        search_string = search_string.lower()
+        methods = [item for item in dir(clss) if search_string in item.lower()]
     else:
-        methods = [item for item in list(dir(clss)) if not item.startswith("_")]
+        methods = [item for item in dir(clss) if not item.startswith("_")]
     if mode == "cli":
         print(methods)
         return None
     return methods
 
+# Root collation order for character lists, created once.
+_root_collator = _icu.Collator.createInstance(_icu.Locale.getRoot())
+_ascii_set = _icu.UnicodeSet(r'\p{Ascii}')
+_ascii_set.freeze()
+
 def character_requirements(languages: _List[str], ngraphs: bool = False, keep_graphemes: bool = True, auxiliary: bool = False, basic_latin: bool = True) -> _List[str]:
     """Generate a list of characters required for a language or locale.
 
@@ -118,32 +169,47 @@ def character_requirements(languages: _List[str], ngraphs: bool = False, keep_gr
     Returns:
         List[str]: _description_
     """
-    collator = _icu.Collator.createInstance(_icu.Locale.getRoot())
-    letters = []
-    for language in languages:
-        ld = _icu.LocaleData(language)
-        us = ld.getExemplarSet(_icu.ULocaleDataExemplarSetType.ES_STANDARD)
-        if auxiliary:
-            us.addAll(ld.getExemplarSet(_icu.ULocaleDataExemplarSetType.ES_AUXILIARY))
-        if not basic_latin:
-            us.removeAll(_icu.UnicodeSet(r'\p{Ascii}'))
-        letters = [*letters, *us]
+    return list(_character_requirements(tuple(languages), ngraphs, keep_graphemes, auxiliary, basic_latin))
+
+# CLDR exemplar data is fixed when ICU is built, so results are cached per set of arguments.
+@_lru_cache(maxsize=64)
+def _character_requirements(languages: tuple[str, ...], ngraphs: bool, keep_graphemes: bool, auxiliary: bool, basic_latin: bool) -> tuple[str, ...]:
+    if len(languages) == 1:
+        return _locale_requirements(languages[0], ngraphs, keep_graphemes, auxiliary, basic_latin)
+    # Merge the already sorted letters of each locale rather than sorting them all again.
+    sorted_letters = [_locale_requirements(language, ngraphs, keep_graphemes, auxiliary, basic_latin) for language in languages]
+    return tuple(dict.fromkeys(_heapq_merge(*sorted_letters, key=_root_collator.getSortKey)))
+
+# Sorted letters for a single locale, shared by language lists that overlap.
+@_lru_cache(maxsize=256)
+def _locale_requirements(language: str, ngraphs: bool, keep_graphemes: bool, auxiliary: bool, basic_latin: bool) -> tuple[str, ...]:
+    ld = _icu.LocaleData(language)
+    us = ld.getExemplarSet(_icu.ULocaleDataExemplarSetType.ES_STANDARD)
+    if auxiliary:
+        us.addAll(ld.getExemplarSet(_icu.ULocaleDataExemplarSetType.ES_AUXILIARY))
+    if not basic_latin:
+        us.removeAll(_ascii_set)
+    letters = list(us)
     if not ngraphs:
         if keep_graphemes:
-            letters = gr("".join(letters))
+            # Segment each exemplar on its own, so graphemes never span neighbouring entries.
+            letters = [g for letter in letters for g in (gr(letter) if len(letter) > 1 else (letter,))]
         else:
             letters = list("".join(letters))
-    letters = sorted(list(set(letters)), key=collator.getSortKey)
-    return letters
+    return tuple(sorted(dict.fromkeys(letters), key=_root_collator.getSortKey))
 
 import wcwidth
+# cwcwidth is a C implementation of the wcwidth API, used when it is installed.
+try:
+    from cwcwidth import wcwidth as _wcwidth, wcswidth as _wcswidth
+except ImportError:
+    from wcwidth import wcwidth as _wcwidth, wcswidth as _wcswidth
 def len_char_terminal(phrase):
-    return tuple(map(wcwidth.wcwidth, phrase))
+    return tuple(map(_wcwidth, phrase))
 def len_string_terminal(phrase):
-    return wcwidth.wcswidth(phrase)
+    return _wcswidth(phrase)
 def max_len_terminal(phrase_list):
-    res = max(phrase_list, key=len_string_terminal)
-    return len_string_terminal(res)
+    return max(map(_wcswidth, phrase_list))
 
 max_width = max_len_terminal
 
@@ -157,10 +223,10 @@ def find_char_index(character:str, ustring:str) -> _Optional[int]:
     Returns:
         Optional[int]: string index for character.
     """
-    idx: int = ustring.find(character)
-    if idx == -1:
+    try:
+        return ustring.index(character)
+    except ValueError:
         return None
-    return idx
 
 def expand_range(start_char='', end_char='', pattern=''):
     if pattern:
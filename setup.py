@@ -21,6 +21,9 @@ setup(
         'unicodedataplus',
         'wcwidth'
     ],
+    extras_require={
+        'fast': ['cwcwidth']
+    },
     classifiers=[
         'Development Status :: 1 - Planning',
         'Intended Audience :: Developers',
@@ -0,0 +1,149 @@
+from collections import Counter
+
+import icu
+import pytest
+import regex
+
+from el_internationalisation.ustrings import (
+    count_ngraphs, count_ngraphs_batch, get_transliterator, graphemes, graphemes_take, isScript,
+    ngraphs, normalise, normalise_batch, tokenise, tokenise_batch, ustr
+)
+
+
+def test_rsplit_overlapping_separator():
+    assert ustr("aaa").rsplit("aa") == "aaa".rsplit("aa") == ["a", ""]
+    assert ustr("aaa").rsplit("aa", 1) == "aaa".rsplit("aa", 1) == ["a", ""]
+
+
+def test_rsplit_limited_is_suffix_of_unlimited():
+    text = "x,y,,z"
+    unlimited = ustr(text).rsplit(",")
+    assert unlimited == text.rsplit(",")
+    for maxsplit in range(1, 5):
+        limited = ustr(text).rsplit(",", maxsplit)
+        assert limited == text.rsplit(",", maxsplit)
+        assert limited[1:] == unlimited[len(unlimited) - len(limited) + 1:]
+
+
+def test_isScript_matches_anchored_regex():
+    for text in ["abc", "abc\n", "\n", "a\n\n", "abc 1", "", "αβγ", "a\nb"]:
+        for script in ["Latin", "Latn", "Greek", "IsLatin"]:
+            for common in (False, True):
+                pattern = r'^[\p{' + script + r'}\p{Common}]+$' if common else r'^\p{' + script + r'}+$'
+                assert isScript(text, script, common) == bool(regex.match(pattern, text))
+
+
+def test_isScript_unknown_script_raises_regex_error():
+    with pytest.raises(regex.error):
+        isScript("abc", "NotAScript")
+
+
+TEXTS = ["", "abc", "Café ngô", "ﬁ ① Å", "Ελληνικά κείμενο.", "नमस्ते दुनिया"]
+
+
+@pytest.mark.parametrize("nf", ["NFC", "NFD", "NFKC", "NFKD"])
+@pytest.mark.parametrize("use_icu", [False, True])
+def test_normalise_batch_matches_normalise(nf, use_icu):
+    assert normalise_batch(nf, TEXTS, use_icu=use_icu, workers=2) == [normalise(nf, text, use_icu=use_icu) for text in TEXTS]
+
+
+@pytest.mark.parametrize("mode", ["grapheme", "word", "sentence", "unknown"])
+def test_tokenise_batch_matches_tokenise(mode):
+    assert tokenise_batch(TEXTS, mode=mode, workers=2) == [tokenise(text, mode=mode) for text in TEXTS]
+
+
+def test_count_ngraphs_batch_matches_count_ngraphs():
+    expected = Counter()
+    for text in TEXTS:
+        expected.update(count_ngraphs(text, 3))
+    assert count_ngraphs_batch(TEXTS, 3, workers=2) == expected
+
+
+def test_batches_of_no_texts_are_empty():
+    assert normalise_batch("NFC", [], workers=2) == []
+    assert tokenise_batch([], workers=2) == []
+    assert count_ngraphs_batch([], workers=2) == Counter()
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 100])
+def test_graphemes_take_is_prefix_of_graphemes(n):
+    for text in TEXTS:
+        assert graphemes_take(text, n) == graphemes(text)[:n]
+
+
+def test_get_transliterator_matches_new_instance():
+    transliterator = get_transliterator("Any-Latin")
+    assert transliterator is get_transliterator("Any-Latin")
+    for text in TEXTS:
+        assert transliterator.transliterate(text) == icu.Transliterator.createInstance("Any-Latin").transliterate(text)
+
+
+@pytest.mark.parametrize("maxsplit", [-1, -2, -10])
+def test_rsplit_negative_maxsplit_is_unlimited(maxsplit):
+    assert ustr("a b c d").rsplit(" ", maxsplit) == "a b c d".rsplit(" ", maxsplit) == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("text, width", [("日本", 4), ("é", 1), ("日本é", 5)])
+def test_padding_uses_terminal_width(text, width):
+    u = ustr(text)
+    assert u.ljust(8) == text + " " * (8 - width)
+    assert u.rjust(8) == " " * (8 - width) + text
+    assert u.center(8, "*") == text.center(len(text) + 8 - width, "*")
+    assert u.ljust(width - 1) == u.rjust(0) == text
+
+
+def test_padding_after_mutation_recalculates_width():
+    u = ustr("日本 ")
+    assert u.rjust(6) == " 日本 "
+    u.rstrip()
+    assert u.rjust(6) == "  日本"
+    assert u.ljust(6) == "日本  "
+
+
+@pytest.mark.parametrize("text, n, expected", [
+    ("abab", 1, {"a": 2, "b": 2}),
+    ("abab", 2, {"ab": 2, "ba": 1}),
+    ("abcab", 3, {"abc": 1, "bca": 1, "cab": 1}),
+    ("ab", 3, {}),
+    ("", 2, {}),
+])
+def test_count_ngraphs(text, n, expected):
+    assert count_ngraphs(text, n) == Counter(expected)
+    assert ngraphs(text, size=n).data == expected
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_ngraphs_reject_sizes_below_one(n):
+    with pytest.raises(ValueError):
+        count_ngraphs("abc", n)
+    with pytest.raises(ValueError):
+        ngraphs("abc", size=n)
+
+
+def test_ngraphs_graphemes():
+    e = "e\u0301"
+    text = e + e + "x"
+    assert ngraphs(text, size=2, graphemes=True).data == {e + e: 1, e + "x": 1}
+    assert ngraphs(text, size=2).data == {e: 2, "\u0301e": 1, "\u0301x": 1}
+    assert ngraphs(text, size=1, graphemes=True).data == {e: 2, "x": 1}
+
+
+def test_ngraphs_filter_drops_punctuation_and_spaces():
+    assert ngraphs("ab, ab", size=2, filter=True).data == {"ab": 2}
+
+
+NORMALISATION_TEXTS = ["", "x\u00adA", "a\u200db", "Ǆ ﬁ Å Straße", "e\u0327\u0301", "\u1e9b\u0323"]
+
+
+@pytest.mark.parametrize("nf", ["NFC", "NFD", "NFKC_CF"])
+@pytest.mark.parametrize("text", NORMALISATION_TEXTS)
+def test_normalise_matches_icu(nf, text):
+    expected = normalise(nf, text, use_icu=True)
+    assert normalise(nf, text, use_icu=False) == expected
+    assert str(ustr(text).normalise(nf, use_icu=False)) == expected
+    assert str(ustr(text).normalise(nf, use_icu=True)) == expected
+
+
+def test_nfkc_casefold_removes_default_ignorables():
+    assert normalise("NFKC_CF", "x\u00adA", use_icu=False) == "xa"
+    assert normalise("NFKC_CF", "a\u200db", use_icu=False) == "ab"
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from el_internationalisation.utilities import DictSearcher, available_methods, search_dict_values
+
+
+def _dictionary():
+    rng = random.Random(1)
+    dictionary = {
+        i: ["".join(rng.choice("abcde") for _ in range(rng.randint(0, 8))) for _ in range(rng.randint(0, 3))]
+        for i in range(300)
+    }
+    dictionary.update({"str": "abcdef", "empty": [], "blank": [""], "nul": ["b\x00c"]})
+    return dictionary
+
+
+@pytest.mark.parametrize("query", ["", "a", "ab", "abc", "abcd", "eeee", "cab", "abcdefg", "x", "b\x00c", "a\x00", "\x00"])
+def test_dict_searcher_matches_search_dict_values(query):
+    dictionary = _dictionary()
+    assert DictSearcher(dictionary).search(query) == search_dict_values(dictionary, query)
+
+
+def test_dict_searcher_empty_dictionary():
+    assert DictSearcher({}).search("abc") == []
+    assert DictSearcher({}).search("") == []
+
+
+def test_available_methods_lists_attributes_added_later():
+    class Example:
+        def first(self):
+            pass
+
+    assert available_methods(Example, "FIRST", mode="script") == ["first"]
+    Example.first_added = lambda self: None
+    assert available_methods(Example, "first", mode="script") == ["first", "first_added"]